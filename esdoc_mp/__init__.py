@@ -8,12 +8,28 @@
 
 
 """
+import time
+
+# N.B. library import time (incl. ontology schemas) is reported when profiling.
+_IMPORT_START = time.time()
+
 from . import exceptions
+from . import profiling
 from . import vocabs
 from esdoc_mp.ontologies.core import create_ontology as get_ontology
+from esdoc_mp.ontologies.core import diff_ontologies
 from esdoc_mp.ontologies.schemas import get_schema
 from esdoc_mp.ontologies.schemas import validate
 from esdoc_mp.ontologies.generators import generate
+from esdoc_mp.ontologies.generators import generate_batch
+from esdoc_mp.ontologies.generators import generate_to_memory
+from esdoc_mp.ontologies.generators import write_files
+from esdoc_mp.ontologies.generators import FileSystemSink
+from esdoc_mp.ontologies.generators import MemorySink
+from esdoc_mp.ontologies.generators import ZipSink
+
+# Library import time (seconds).
+IMPORT_ELAPSED = time.time() - _IMPORT_START
 
 
 
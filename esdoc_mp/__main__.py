@@ -9,6 +9,8 @@
 
 """
 import argparse
+import cProfile
+import time
 
 import esdoc_mp as mp
 
@@ -18,19 +20,19 @@ import esdoc_mp as mp
 _parser = argparse.ArgumentParser("ES-DOC Code Generator.")
 _parser.add_argument(
     "-s", "--schema-name",
-    help="Target ontology schema. [default = cim]",
+    help="Target ontology schema(s), comma separated. [default = cim]",
     dest="schema_name",
     type=str
     )
 _parser.add_argument(
     "-v", "--schema-version",
-    help="Target ontology schema version. [default = 1]",
+    help="Target ontology schema version(s), comma separated. [default = 1]",
     dest="schema_version",
     type=str
     )
 _parser.add_argument(
     "-l", "--language",
-    help="Target programming language. [default = python]",
+    help="Target programming language(s), comma separated. [default = python]",
     dest="language",
     type=str
     )
@@ -40,15 +42,114 @@ _parser.add_argument(
     dest="output_dir",
     type=str
     )
+_parser.add_argument(
+    "-j", "--jobs",
+    help="Number of generators (or schemas when batching) to process concurrently. [default = 1]",
+    dest="jobs",
+    type=int,
+    default=1
+    )
+_parser.add_argument(
+    "--incremental",
+    help="Skip generation of output whose inputs are unchanged since previous run.",
+    dest="incremental",
+    action="store_true"
+    )
+_parser.add_argument(
+    "--slots",
+    help="Generate python typeset classes with __slots__ (reduces instance memory, instances cannot hold ad hoc attributes).",
+    dest="slots",
+    action="store_true"
+    )
+_parser.add_argument(
+    "--lazy",
+    help="Generate a python package whose modules & type information tables are imported upon first access.",
+    dest="lazy",
+    action="store_true"
+    )
+_parser.add_argument(
+    "--write-jobs",
+    help="Number of background threads writing generated files. [default = 0, i.e. written synchronously]",
+    dest="write_jobs",
+    type=int,
+    default=0
+    )
+_parser.add_argument(
+    "--zip",
+    help="Path to a zip archive to which generated files will be written (paths relative to output directory).",
+    dest="zip",
+    type=str,
+    default=None
+    )
+_parser.add_argument(
+    "--profile",
+    help="Path to a file to which a JSON report of per stage timings & counts will be written.",
+    dest="profile",
+    type=str,
+    default=None
+    )
+_parser.add_argument(
+    "--cprofile",
+    help="Path to a file to which cProfile stats will be dumped.",
+    dest="cprofile",
+    type=str,
+    default=None
+    )
 
 
 # Set command line options.
 args = _parser.parse_args()
 
-# Set ontology schema.
-schema = mp.get_schema(args.schema_name, args.schema_version)
-if schema is None:
-    raise mp.exceptions.UnsupportedOntologySchema('Unsupported schema: {0} v{1}.'.format(args.schema_name, args.schema_version))
+# Set ontology schemas.
+schemas = []
+for schema_name in args.schema_name.split(","):
+    for schema_version in args.schema_version.split(","):
+        schema = mp.get_schema(schema_name, schema_version)
+        if schema is None:
+            raise mp.exceptions.UnsupportedOntologySchema('Unsupported schema: {0} v{1}.'.format(schema_name, schema_version))
+        schemas.append(schema)
+
+# Set target languages.
+languages = args.language.split(",")
+
+# Activate instrumentation.
+if args.profile:
+    mp.profiling.enable()
+    mp.profiling.record('import', mp.IMPORT_ELAPSED)
+if args.cprofile:
+    profiler = cProfile.Profile()
+    profiler.enable()
+
+# Set generator options.
+options = {
+    'lazy': args.lazy,
+    'slots': args.slots
+}
+
+# Set output sink.
+if args.zip:
+    sink = mp.ZipSink(args.zip, args.output_dir)
+else:
+    sink = mp.FileSystemSink(args.output_dir, args.write_jobs)
 
 # Generate.
-mp.generate(schema, args.language, args.output_dir)
+start = time.time()
+with sink:
+    if len(schemas) == 1 and len(languages) == 1:
+        mp.generate(schemas[0], languages[0], args.output_dir, args.jobs, args.incremental, options, sink)
+    else:
+        mp.generate_batch(schemas, languages, args.output_dir, args.jobs, args.incremental, options, sink)
+
+# Write profiling output.
+if args.cprofile:
+    profiler.disable()
+    profiler.dump_stats(args.cprofile)
+if args.profile:
+    mp.profiling.record('total', time.time() - start + mp.IMPORT_ELAPSED)
+    mp.profiling.write_report(args.profile,
+                              schemas=["{0}.v{1}".format(s.NAME, s.VERSION) for s in schemas],
+                              languages=languages,
+                              jobs=args.jobs,
+                              incremental=args.incremental,
+                              write_jobs=args.write_jobs,
+                              options=options)
@@ -0,0 +1,10 @@
+"""
+.. module:: esdoc_mp.benchmarks.__init__.py
+   :license: GPL/CeCIL
+   :platform: Unix, Windows
+   :synopsis: esdoc_mp micro-benchmarks sub-package initializer.
+
+.. moduleauthor:: Mark Conway-Greenslade <momipsl@ipsl.jussieu.fr>
+
+
+"""
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: esdoc_mp.benchmarks.code_writer.py
+   :platform: Unix, Windows
+   :synopsis: Micro-benchmark of code writer versus string concatenation / chained replacement.
+
+.. moduleauthor:: Mark Conway-Greenslade <momipsl@ipsl.jussieu.fr>
+
+
+"""
+import argparse
+import timeit
+
+from esdoc_mp.ontologies.core import create_ontology
+from esdoc_mp.ontologies.generators import generator_utils as gu
+from esdoc_mp.ontologies.generators.code_writer import CodeTemplate
+from esdoc_mp.ontologies.generators.code_writer import CodeWriter
+from esdoc_mp.ontologies.generators.code_writer import substitute
+from esdoc_mp.ontologies.generators.generator_context import GeneratorContext
+from esdoc_mp.ontologies.generators.python import package_typeset_generator
+from esdoc_mp.ontologies.generators.python import utils as pgu
+from esdoc_mp.ontologies.schemas import get_schema
+
+
+
+# Define command line options.
+_ARGS = argparse.ArgumentParser("Benchmarks code writer against string concatenation & chained replacement.")
+_ARGS.add_argument(
+    "-s", "--schema",
+    help="Name of ontology schema used to generate benchmark inputs.",
+    dest="schema",
+    type=str,
+    default="cim"
+    )
+_ARGS.add_argument(
+    "-v", "--version",
+    help="Version of ontology schema used to generate benchmark inputs.",
+    dest="version",
+    type=str,
+    default="2"
+    )
+_ARGS.add_argument(
+    "-n", "--number",
+    help="Number of executions per timing.",
+    dest="number",
+    type=int,
+    default=20
+    )
+
+# Standard params substituted into generated code.
+_PARAMS = {
+    'ontology-name': 'cim',
+    'ontology-version': '2.0',
+    'ontology-version-packagename': '2_0',
+    'datetime-year': '2016',
+    'user-name': 'esdoc'
+}
+
+
+def _replace(code, params):
+    """Substitutes placeholders via chained replacement (previous implementation).
+
+    """
+    for key, value in params.items():
+        code = code.replace("{" + key + "}", value)
+
+    return code
+
+
+def _concatenate(lines, indent):
+    """Emits indented lines via reduce based concatenation (previous implementation).
+
+    """
+    code = ''
+    for line in lines:
+        code += reduce(lambda x, y: x + '    ', range(indent), '') + line
+        code += reduce(lambda x, y: x + '\n', range(1), '')
+
+    return code
+
+
+def _write(lines, indent):
+    """Emits indented lines via a code writer.
+
+    """
+    w = CodeWriter(level=indent)
+    for line in lines:
+        w.write_line(line)
+
+    return w.getvalue()
+
+
+def _get_inputs(schema):
+    """Returns benchmark inputs, i.e. a set of generated modules, template texts & lines.
+
+    """
+    ontology = create_ontology(schema)
+    pgu.format(ontology)
+    modules = [package_typeset_generator._emit_module_typeset_for_pkg(ontology, p)
+               for p in ontology.packages]
+    modules += [GeneratorContext(t, ontology, 'python', None).get_code(t, pgu)
+                for t in ('type_info.tornado', 'typeset.tornado', '__init__.tornado')]
+    templates = gu.load_templates('python', (
+        'typeset_class_concrete.txt',
+        'typeset_enum.txt',
+        'decoder_function.txt'
+        )).values()
+    lines = [l for m in modules for l in m.splitlines()]
+
+    return ontology, modules, templates, lines
+
+
+def _main(args):
+    """Main entry point.
+
+    """
+    ontology, modules, templates, lines = _get_inputs(get_schema(args.schema, args.version))
+    compiled = [CodeTemplate(t) for t in templates]
+    params = dict(_PARAMS, **{
+        'class-name': 'Foo',
+        'enum-name': 'Bar',
+        'package-name': 'baz'
+        })
+
+    cases = (
+        ("format_code :: chained replace",
+            lambda: [_replace(m, _PARAMS) for m in modules]),
+        ("format_code :: single pass",
+            lambda: [substitute(m, _PARAMS) for m in modules]),
+        ("template :: chained replace",
+            lambda: [_replace(t, params) for t in templates * 100]),
+        ("template :: single pass (precompiled)",
+            lambda: [t.substitute(params) for t in compiled * 100]),
+        ("indented lines :: reduce concatenation",
+            lambda: _concatenate(lines, 2)),
+        ("indented lines :: code writer",
+            lambda: _write(lines, 2)),
+        ("typeset modules :: emit",
+            lambda: [package_typeset_generator._emit_module_typeset_for_pkg(ontology, p)
+                     for p in ontology.packages]),
+    )
+
+    print "{0} v{1} :: {2} modules, {3} lines ({4} bytes)".format(
+        ontology.name, ontology.version, len(modules), len(lines), sum(len(m) for m in modules))
+    for name, func in cases:
+        elapsed = min(timeit.repeat(func, number=args.number, repeat=3)) / args.number
+        print "{0}{1:10.3f} ms".format(name.ljust(45), elapsed * 1000)
+
+
+# Entry point.
+if __name__ == '__main__':
+    _main(_ARGS.parse_args())
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: esdoc_mp.benchmarks.decoder.py
+   :platform: Unix, Windows
+   :synopsis: Throughput benchmark of generated decoders over a synthetic document corpus.
+
+.. moduleauthor:: Mark Conway-Greenslade <momipsl@ipsl.jussieu.fr>
+
+
+"""
+import argparse
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from lxml import etree as et
+
+from esdoc_mp.ontologies.core import create_ontology
+from esdoc_mp.ontologies.generators import generate
+from esdoc_mp.ontologies.generators.python import utils as pgu
+from esdoc_mp.ontologies.schemas import get_schema
+
+
+
+# Define command line options.
+_ARGS = argparse.ArgumentParser("Benchmarks generated decoders over a synthetic document corpus.")
+_ARGS.add_argument(
+    "-s", "--schema",
+    help="Name of ontology schema whose decoders are benchmarked.",
+    dest="schema",
+    type=str,
+    default="cim"
+    )
+_ARGS.add_argument(
+    "-v", "--version",
+    help="Version of ontology schema whose decoders are benchmarked.",
+    dest="version",
+    type=str,
+    default="1"
+    )
+_ARGS.add_argument(
+    "-n", "--count",
+    help="Number of documents to decode.",
+    dest="count",
+    type=int,
+    default=1000
+    )
+_ARGS.add_argument(
+    "-w", "--workers",
+    help="Number of worker processes used when decoding files via decode_many.",
+    dest="workers",
+    type=int,
+    default=2
+    )
+
+# XML namespaces referenced by decoding xpaths (the default namespace is mapped to cim).
+_XML_NAMESPACES = {
+    None: 'http://www.purl.org/org/esmetadata/cim/1.5/schemas',
+    'gco': 'http://www.isotc211.org/2005/gco',
+    'gmd': 'http://www.isotc211.org/2005/gmd',
+    'gml': 'http://www.opengis.net/gml/3.2',
+    'xlink': 'http://www.w3.org/1999/xlink',
+    'xsi': 'http://www.w3.org/2001/XMLSchema-instance',
+}
+
+# Decoding xpath attribute step reg-ex, e.g. @xlink:href.
+_RE_XPATH_ATTRIBUTE = re.compile(r'^@(([a-zA-Z]+):)?([a-zA-Z0-9_\-]+)$')
+
+# Synthetic document simple type values.
+_SYNTHETIC_VALUES = {
+    'bool': 'true',
+    'datetime.date': '2015-01-01',
+    'datetime.datetime': '2015-01-01T00:00:00',
+    'float': '1.5',
+    'int': '1',
+    'uuid.UUID': '2ba4b4ea-7d7c-4c2e-9a1a-3a5e4b8c1d2f',
+}
+
+# Synthetic document depth, i.e. depth to which associated classes are synthesized.
+_SYNTHETIC_DEPTH = 2
+
+# Script decoding corpus within a fresh interpreter, i.e. the generated package is importable.
+_MEASURE = """
+import json, sys, time
+sys.path.insert(0, sys.argv[1])
+from lxml import etree as et
+import decoder
+from decoder_xml_utils import load_xml
+
+with open(sys.argv[2], 'r') as f:
+    corpus = [(getattr(decoder, func), path) for func, path in json.loads(f.read())]
+
+def run(include_parse):
+    docs = []
+    for func, path in corpus:
+        with open(path, 'r') as f:
+            docs.append((func, f.read()))
+    if not include_parse:
+        docs = [(func, load_xml(et.fromstring(xml), return_nsmap=True)) for func, xml in docs]
+    start = time.time()
+    for func, xml in docs:
+        if include_parse:
+            xml = load_xml(et.fromstring(xml), return_nsmap=True)
+        func(*xml)
+    return len(docs) / (time.time() - start)
+
+# Warm up, i.e. decoder plans & imports are resolved prior to timing.
+for func, path in corpus[:50]:
+    func(*load_xml(path, return_nsmap=True))
+
+paths = [path for _, path in corpus]
+print json.dumps({
+    'decode': run(False),
+    'parse + decode': run(True),
+    'decode_many (1 worker)': decoder.decode_many(paths, 1)[1]['documents_per_second'],
+    'decode_many ({0} workers)'.format(sys.argv[3]): decoder.decode_many(paths, int(sys.argv[3]))[1]['documents_per_second']
+    })
+"""
+
+
+def get_synthetic_documents(ontology):
+    """Returns a synthetic xml document per document type, derived from each class's decodings.
+
+    :param esdoc_mp.ontologies.core.Ontology ontology: An ontology formatted for python.
+
+    :returns: Set of (decoder function name, xml) tuples.
+    :rtype: list
+
+    """
+    tags = pgu.get_document_tags(ontology)
+
+    return [(pgu.get_decoder_function_name(c), _get_synthetic_document(ontology, c, tags[c]))
+            for c in sorted(ontology.entities, key=lambda c: c.op_func_name)]
+
+
+def _get_synthetic_document(o, c, tag):
+    """Returns a synthetic xml document derived from a class's decodings."""
+    root = et.Element(_get_synthetic_tag(None, tag), nsmap=_XML_NAMESPACES)
+    _set_synthetic_node(o, c, root, 0)
+
+    return et.tostring(root)
+
+
+def _get_synthetic_tag(prefix, name):
+    """Returns a namespace qualified synthetic xml tag."""
+    return "{{{0}}}{1}".format(_XML_NAMESPACES[None if prefix == 'cim' else prefix], name)
+
+
+def _set_synthetic_node(o, c, node, depth):
+    """Appends synthetic xml derived from a class's decodings to an xml node."""
+    for p in sorted(c.all_properties, key=lambda p: p.name):
+        for dc in c.get_property_decodings(p):
+            if dc.decoding is None:
+                continue
+
+            # Parse xpath - escape if unsupported.
+            steps = [s for s in dc.decoding.split('/') if s != 'text()']
+            elements = [pgu.RE_XPATH_ELEMENT.match(s) for s in steps]
+            attribute = _RE_XPATH_ATTRIBUTE.match(steps[-1]) if steps else None
+            if attribute:
+                elements = elements[:-1]
+            if not steps or not all(elements):
+                continue
+
+            # Append xml elements.
+            target = node
+            for idx, element in enumerate(elements):
+                tag = _get_synthetic_tag(element.group(2), element.group(3))
+                if element.group(1) == 'self::':
+                    if idx or target.tag != tag:
+                        break
+                elif idx < len(elements) - 1 or attribute:
+                    child = target.find(tag)
+                    target = et.SubElement(target, tag) if child is None else child
+                else:
+                    target = et.SubElement(target, tag)
+            else:
+                _set_synthetic_value(o, p, dc, target, attribute, depth)
+
+
+def _set_synthetic_value(o, p, dc, node, attribute, depth):
+    """Sets synthetic value of a decoded property."""
+    # Complex types are synthesized to a limited depth.
+    if p.type.is_class:
+        if not attribute and depth < _SYNTHETIC_DEPTH:
+            _set_synthetic_node(o, o.get_type(dc.type or p.type.name), node, depth + 1)
+        return
+
+    if p.type.is_enum:
+        members = o.get_type(p.type.name).members
+        value = members[0].name if members else p.name
+    else:
+        value = _SYNTHETIC_VALUES.get(pgu.get_type_functional_name(p.type), p.name)
+
+    if attribute and attribute.group(2):
+        node.set(_get_synthetic_tag(attribute.group(2), attribute.group(3)), value)
+    elif attribute:
+        node.set(attribute.group(3), value)
+    else:
+        node.text = value
+
+
+def _write_corpus(documents, count, io_dir):
+    """Writes a corpus of synthetic documents (one per file) returning path to corpus index."""
+    corpus = []
+    for idx in xrange(count):
+        func, xml = documents[idx % len(documents)]
+        corpus.append((func, os.path.join(io_dir, "{0}.xml".format(idx))))
+        with open(corpus[-1][1], 'w') as f:
+            f.write(xml)
+
+    fpath = os.path.join(io_dir, "corpus.json")
+    with open(fpath, 'w') as f:
+        f.write(json.dumps(corpus))
+
+    return fpath
+
+
+def _main(args):
+    """Main entry point.
+
+    """
+    schema = get_schema(args.schema, args.version)
+    ontology = create_ontology(schema)
+    pgu.format(ontology)
+    if not ontology.decodings:
+        raise ValueError("Schema does not declare decodings [{0} v{1}].".format(schema.NAME, schema.VERSION))
+
+    io_dir = tempfile.mkdtemp()
+    try:
+        generate(schema, 'python', io_dir)
+        corpus = _write_corpus(get_synthetic_documents(ontology), args.count, io_dir)
+        package_dir = os.path.join(io_dir, schema.NAME, "v{0}".format(schema.VERSION.split('.')[0]))
+        stats = json.loads(subprocess.check_output([
+            sys.executable, '-c', _MEASURE, package_dir, corpus, str(args.workers)
+            ]))
+    finally:
+        shutil.rmtree(io_dir)
+
+    print "{0} v{1} :: {2} synthetic documents ({3} document types)".format(
+        schema.NAME, schema.VERSION, args.count, len(ontology.entities))
+    for name, docs_per_second in sorted(stats.items()):
+        print "{0}{1:10.1f} documents per second".format(name.ljust(28), docs_per_second)
+
+
+# Entry point.
+if __name__ == '__main__':
+    _main(_ARGS.parse_args())
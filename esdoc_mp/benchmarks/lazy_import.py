@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: esdoc_mp.benchmarks.lazy_import.py
+   :platform: Unix, Windows
+   :synopsis: Import time benchmark of generated packages with & without lazy imports.
+
+.. moduleauthor:: Mark Conway-Greenslade <momipsl@ipsl.jussieu.fr>
+
+
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from esdoc_mp.ontologies.generators import generate
+from esdoc_mp.ontologies.schemas import get_schema
+
+
+
+# Define command line options.
+_ARGS = argparse.ArgumentParser("Benchmarks import time of generated packages with & without lazy imports.")
+_ARGS.add_argument(
+    "-s", "--schema",
+    help="Name of ontology schema whose package is benchmarked.",
+    dest="schema",
+    type=str,
+    default="cim"
+    )
+_ARGS.add_argument(
+    "-v", "--version",
+    help="Version of ontology schema whose package is benchmarked.",
+    dest="version",
+    type=str,
+    default="2"
+    )
+_ARGS.add_argument(
+    "-n", "--number",
+    help="Number of interpreters launched per timing.",
+    dest="number",
+    type=int,
+    default=5
+    )
+
+# Script timing package import within a fresh interpreter, i.e. nothing is previously imported.
+_MEASURE = """
+import json, sys, time
+sys.path.insert(0, sys.argv[1])
+start = time.time()
+package = __import__(sys.argv[2])
+timings = {'import': time.time() - start}
+getattr(package, sys.argv[3])()
+timings['single_type'] = time.time() - start
+package.type_info.CLASSES
+timings['type_info'] = time.time() - start
+timings['modules'] = len([m for m in sys.modules if m.startswith(sys.argv[2] + '.') and sys.modules[m]])
+print json.dumps(timings)
+"""
+
+# Stages reported, i.e. cumulative time to import package, instantiate a single type & access type information.
+_STAGES = ('import', 'single_type', 'type_info')
+
+
+def _get_entity_name(schema):
+    """Returns name of first entity class as exposed by the generated package.
+
+    """
+    from esdoc_mp.ontologies.core import create_ontology
+    from esdoc_mp.ontologies.generators.python import utils as pgu
+
+    ontology = create_ontology(schema)
+    pgu.format(ontology)
+
+    return sorted(c.op_name for c in ontology.entities)[0]
+
+
+def _measure(schema, lazy, number):
+    """Generates a package & measures its import time within a set of sub-processes.
+
+    """
+    io_dir = tempfile.mkdtemp()
+    try:
+        generate(schema, 'python', io_dir, options={'lazy': lazy})
+        package = "v{0}".format(schema.VERSION.split('.')[0])
+        cmd = [sys.executable, '-c', _MEASURE, os.path.join(io_dir, schema.NAME), package, _get_entity_name(schema)]
+        timings = [json.loads(subprocess.check_output(cmd)) for _ in range(number)]
+
+        return {k: min(t[k] for t in timings) for k in timings[0]}
+    finally:
+        shutil.rmtree(io_dir)
+
+
+def _main(args):
+    """Main entry point.
+
+    """
+    schema = get_schema(args.schema, args.version)
+    results = [(label, _measure(schema, lazy, args.number))
+               for label, lazy in (("eager", False), ("lazy", True))]
+
+    print "{0} v{1} :: cumulative elapsed time (ms), best of {2} interpreters".format(
+        schema.NAME, schema.VERSION, args.number)
+    print "{0}{1}{2}".format("".ljust(12), "".join(i.rjust(14) for i in _STAGES), "modules".rjust(10))
+    for label, timings in results:
+        print "{0}{1}{2}".format(
+            label.ljust(12),
+            "".join("{0:14.1f}".format(timings[i] * 1000) for i in _STAGES),
+            str(timings['modules']).rjust(10))
+
+
+# Entry point.
+if __name__ == '__main__':
+    _main(_ARGS.parse_args())
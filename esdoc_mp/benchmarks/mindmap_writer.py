@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: esdoc_mp.benchmarks.mindmap_writer.py
+   :platform: Unix, Windows
+   :synopsis: Benchmark of CMIP6 mindmap serialization, element tree versus streaming writer.
+
+.. moduleauthor:: Mark Conway-Greenslade <momipsl@ipsl.jussieu.fr>
+
+
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import xml.etree.ElementTree as ET
+
+from esdoc_mp.vocabs.cmip6.generators.mindmap import _MindmapWriter
+from esdoc_mp.vocabs.cmip6.generators.mindmap import _NOTE
+
+
+
+# Define command line options.
+_ARGS = argparse.ArgumentParser("Benchmarks serialization of a synthetic CMIP6 mindmap.")
+_ARGS.add_argument(
+    "-f", "--fanout",
+    help="Number of child nodes per node, i.e. 10 -> ~100k nodes.",
+    dest="fanout",
+    type=int,
+    default=10
+    )
+
+# Script measuring a single serialization within a fresh interpreter, i.e. max rss is per writer.
+_MEASURE = """
+import json, sys
+from esdoc_mp.benchmarks.mindmap_writer import _measure
+print json.dumps(_measure(sys.argv[1], int(sys.argv[2]), sys.argv[3]))
+"""
+
+# Notes template as previously parsed per node.
+_NOTES = """
+<html>
+  <head></head>
+  <body>
+    <dl>
+        {}
+    </dl>
+  </body>
+</html>
+"""
+
+# Synthetic node attributes.
+_ATTS = {'FOLDED': 'true', 'COLOR': '#000000', 'BACKGROUND_COLOR': '#ffffff', 'STYLE': 'bubble'}
+_FONT = {'BOLD': 'True', 'NAME': 'Arial', 'SIZE': '12'}
+
+# Depth of synthetic tree, i.e. realm -> process -> sub-process -> detail -> property -> choice.
+_DEPTH = 5
+
+
+class _Node(object):
+    """A synthetic vocab node."""
+    def __init__(self, id_):
+        self.id = id_
+
+
+def _get_nodes(fanout, parent=None, id_="cmip6.synthetic", depth=0):
+    """Yields (parent, node, attributes, notes) in parse order, nodes are created lazily."""
+    node = _Node(id_)
+    atts = dict(_ATTS, TEXT=id_.split('.')[-1], LINK="https://es-doc.org/{}".format(id_.replace('.', '/')))
+    notes = None if depth == _DEPTH else [
+        ("Description", "Synthetic description of {} (& some <markup> to escape).".format(id_)),
+        ("ID", id_),
+        ("Python Definition", atts['LINK'])
+        ]
+    yield parent, node, atts, notes
+
+    if depth < _DEPTH:
+        for idx in xrange(fanout if depth < _DEPTH - 1 else fanout - 1):
+            for item in _get_nodes(fanout, node, "{}.n{}".format(id_, idx), depth + 1):
+                yield item
+
+
+def _write_tree(nodes, fpath):
+    """Writes mindmap via an element tree, i.e. as per previous mindmap generator."""
+    root = ET.Element('map', {})
+    elements = {None: root}
+    for parent, node, atts, notes in nodes:
+        elements[node] = element = ET.SubElement(elements[parent], 'node', atts)
+        ET.SubElement(element, 'font', _FONT)
+        if notes:
+            content = ET.SubElement(element, 'richcontent', {"TYPE": "NOTE"})
+            content.append(ET.fromstring(_NOTES.format("".join(
+                _NOTE.format(k, v.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;'))
+                for k, v in notes))))
+
+    with open(fpath, 'w') as f:
+        f.write(ET.tostring(root))
+
+
+def _write_stream(nodes, fpath):
+    """Writes mindmap via streaming writer."""
+    with open(fpath, 'w') as f:
+        writer = _MindmapWriter(f)
+        for parent, node, atts, notes in nodes:
+            writer.write_node(parent, node, atts)
+            writer.write_font(_FONT)
+            if notes:
+                writer.write_notes(notes)
+        writer.close()
+
+
+def _measure(mode, fanout, fpath):
+    """Serializes a synthetic mindmap & returns timing / memory stats.
+
+    """
+    import resource
+    import time
+
+    write = _write_tree if mode == 'tree' else _write_stream
+    count = [0]
+    def _count(nodes):
+        for item in nodes:
+            count[0] += 1
+            yield item
+
+    start = time.time()
+    write(_count(_get_nodes(fanout)), fpath)
+
+    return {
+        'nodes': count[0],
+        'elapsed': time.time() - start,
+        'rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        'bytes': os.path.getsize(fpath)
+        }
+
+
+def _main(args):
+    """Main entry point.
+
+    """
+    results = []
+    for mode in ('tree', 'stream'):
+        fd, fpath = tempfile.mkstemp(suffix=".mm")
+        os.close(fd)
+        try:
+            results.append((mode, json.loads(subprocess.check_output([
+                sys.executable, '-c', _MEASURE, mode, str(args.fanout), fpath
+                ]))))
+        finally:
+            os.remove(fpath)
+
+    print "synthetic mindmap :: {0} nodes :: {1:.1f} MB".format(results[0][1]['nodes'], results[0][1]['bytes'] / 1048576.0)
+    print "{0}{1}{2}".format("".ljust(12), "elapsed (s)".rjust(14), "max rss (MB)".rjust(16))
+    for mode, stats in results:
+        print "{0}{1:14.3f}{2:16.1f}".format(mode.ljust(12), stats['elapsed'], stats['rss_kb'] / 1024.0)
+
+
+# Entry point.
+if __name__ == '__main__':
+    _main(_ARGS.parse_args())
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: esdoc_mp.benchmarks.ontology_build.py
+   :platform: Unix, Windows
+   :synopsis: Benchmark of ontology construction with indexed versus scanning type lookup.
+
+.. moduleauthor:: Mark Conway-Greenslade <momipsl@ipsl.jussieu.fr>
+
+
+"""
+import argparse
+import timeit
+
+from esdoc_mp.ontologies.core import create_ontology
+from esdoc_mp.ontologies.core import Ontology
+from esdoc_mp.ontologies.schemas import get_schema
+
+
+
+# Define command line options.
+_ARGS = argparse.ArgumentParser("Benchmarks ontology construction with indexed & scanning type lookup.")
+_ARGS.add_argument(
+    "-s", "--schema",
+    help="Name of ontology schema whose construction is benchmarked.",
+    dest="schema",
+    type=str,
+    default="cim"
+    )
+_ARGS.add_argument(
+    "-v", "--versions",
+    help="Comma delimited versions of ontology schema whose construction is benchmarked.",
+    dest="versions",
+    type=str,
+    default="1,2"
+    )
+_ARGS.add_argument(
+    "-n", "--number",
+    help="Number of constructions per timing.",
+    dest="number",
+    type=int,
+    default=20
+    )
+
+
+def _get_type_by_scan(self, name):
+    """Returns type with matching name by scanning all types (previous implementation).
+
+    """
+    pkg_name = name.split('.')[0]
+    type_name = name.split('.')[1]
+    for t in self.types:
+        if t.package.name == pkg_name and t.name == type_name:
+            return t
+
+
+def _time(schema, number):
+    """Returns mean ontology construction time in milliseconds."""
+    return min(timeit.repeat(lambda: create_ontology(schema), number=number, repeat=3)) / number * 1000
+
+
+def _main(args):
+    """Main entry point.
+
+    """
+    print "{0}{1}{2}{3}".format("".ljust(12), "types".rjust(8), "scan (ms)".rjust(12), "index (ms)".rjust(12))
+    for version in args.versions.split(","):
+        schema = get_schema(args.schema, version)
+        indexed = Ontology.get_type
+        Ontology.get_type = _get_type_by_scan
+        try:
+            scan = _time(schema, args.number)
+        finally:
+            Ontology.get_type = indexed
+        index = _time(schema, args.number)
+
+        print "{0}{1:8}{2:12.2f}{3:12.2f}".format(
+            "{0} v{1}".format(schema.NAME, schema.VERSION).ljust(12),
+            len(create_ontology(schema).types), scan, index)
+
+
+# Entry point.
+if __name__ == '__main__':
+    _main(_ARGS.parse_args())
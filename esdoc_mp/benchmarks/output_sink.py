@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: esdoc_mp.benchmarks.output_sink.py
+   :platform: Unix, Windows
+   :synopsis: Benchmark of the generated file output stage across output sinks.
+
+.. moduleauthor:: Mark Conway-Greenslade <momipsl@ipsl.jussieu.fr>
+
+
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from esdoc_mp import utils
+from esdoc_mp.ontologies.generators import generate
+from esdoc_mp.ontologies.generators import generator_utils as gu
+from esdoc_mp.ontologies.generators import FileSystemSink
+from esdoc_mp.ontologies.generators import MemorySink
+from esdoc_mp.ontologies.generators import ZipSink
+from esdoc_mp.ontologies.schemas import get_schema
+
+
+
+# Define command line options.
+_ARGS = argparse.ArgumentParser("Benchmarks writing of generated files via each output sink.")
+_ARGS.add_argument(
+    "-s", "--schema",
+    help="Name of ontology schema whose generated files are written.",
+    dest="schema",
+    type=str,
+    default="cim"
+    )
+_ARGS.add_argument(
+    "-v", "--version",
+    help="Version of ontology schema whose generated files are written.",
+    dest="version",
+    type=str,
+    default="2"
+    )
+_ARGS.add_argument(
+    "-l", "--language",
+    help="Programming language of generated files.",
+    dest="language",
+    type=str,
+    default="python"
+    )
+_ARGS.add_argument(
+    "-o", "--output-dir",
+    help="Directory under which files are written, e.g. an NFS mount. [default = system temp directory]",
+    dest="output_dir",
+    type=str,
+    default=None
+    )
+_ARGS.add_argument(
+    "-n", "--number",
+    help="Number of timings per sink.",
+    dest="number",
+    type=int,
+    default=5
+    )
+
+
+def _write_legacy(files, io_dir):
+    """Writes files via generator_utils.write_file, i.e. one makedirs & open per file."""
+    for fpath, code in files:
+        gu.write_file(code, os.path.join(io_dir, os.path.dirname(fpath)), os.path.basename(fpath))
+
+
+def _write_sink(files, io_dir, sink):
+    """Writes files via an output sink."""
+    with sink:
+        for fpath, code in files:
+            sink.write(code, os.path.join(io_dir, os.path.dirname(fpath)), os.path.basename(fpath))
+
+
+def _measure(files, output_dir, write, number):
+    """Returns best elapsed time of writing a set of files."""
+    timings = []
+    for _ in range(number):
+        io_dir = tempfile.mkdtemp(dir=output_dir)
+        try:
+            start = time.time()
+            write(files, io_dir)
+            timings.append(time.time() - start)
+        finally:
+            shutil.rmtree(io_dir)
+
+    return min(timings)
+
+
+def _main(args):
+    """Main entry point.
+
+    """
+    utils.log = lambda *args: None
+    schema = get_schema(args.schema, args.version)
+
+    # Collect generated files in memory.
+    memory = MemorySink('/')
+    generate(schema, args.language, '/', sink=memory)
+    files = sorted(memory.files.items())
+
+    sinks = [
+        ("legacy", _write_legacy),
+        ("sync", lambda f, d: _write_sink(f, d, FileSystemSink(d))),
+        ("threads=4", lambda f, d: _write_sink(f, d, FileSystemSink(d, 4))),
+        ("threads=8", lambda f, d: _write_sink(f, d, FileSystemSink(d, 8))),
+        ("memory", lambda f, d: _write_sink(f, d, MemorySink(d))),
+        ("zip", lambda f, d: _write_sink(f, d, ZipSink(os.path.join(d, "output.zip"), d)))
+    ]
+
+    print "{0} v{1} {2} :: {3} files, {4} bytes, best of {5}".format(
+        schema.NAME, schema.VERSION, args.language, len(files), sum(len(c) for _, c in files), args.number)
+    for label, write in sinks:
+        print "{0}{1:10.1f} ms".format(label.ljust(12), _measure(files, args.output_dir, write, args.number) * 1000)
+
+
+# Entry point.
+if __name__ == '__main__':
+    _main(_ARGS.parse_args())
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: esdoc_mp.benchmarks.schema_validation.py
+   :platform: Unix, Windows
+   :synopsis: Benchmark of schema validation time versus schema type count.
+
+.. moduleauthor:: Mark Conway-Greenslade <momipsl@ipsl.jussieu.fr>
+
+
+"""
+import argparse
+import string
+import timeit
+import types
+
+from esdoc_mp.ontologies.core.schema_validation import validate
+from esdoc_mp.ontologies.core.schema_validation import ValidationContext
+from esdoc_mp.ontologies.schemas import get_schema
+
+
+
+# Define command line options.
+_ARGS = argparse.ArgumentParser("Benchmarks schema validation time against number of schema types.")
+_ARGS.add_argument(
+    "-s", "--sizes",
+    help="Comma delimited type counts of synthetic schemas.",
+    dest="sizes",
+    type=str,
+    default="100,200,400,800,1600,3200"
+    )
+_ARGS.add_argument(
+    "-n", "--number",
+    help="Number of validations per timing.",
+    dest="number",
+    type=int,
+    default=5
+    )
+
+# Number of types per synthetic package.
+_PACKAGE_SIZE = 20
+
+
+def _get_name(idx):
+    """Returns a lower case alphabetic name, i.e. schema names may not contain digits."""
+    name = ''
+    while True:
+        name = string.ascii_lowercase[idx % 26] + name
+        idx //= 26
+        if not idx:
+            return name
+
+
+def _get_function(name, result):
+    """Returns a documented no-arg factory function."""
+    func = lambda: result
+    func.__name__ = name
+    func.__doc__ = "Synthetic {0}.".format(name)
+
+    return func
+
+
+def _get_synthetic_schema(type_count):
+    """Returns a valid synthetic schema declaring a number of classes.
+
+    Each class extends its predecessor within the package & holds properties referencing
+    simple types & another class of the package.
+
+    """
+    schema = types.ModuleType('synthetic')
+    schema.NAME = 'synthetic'
+    schema.VERSION = '1'
+    schema.DOC = 'Synthetic schema.'
+    for pkg_idx in xrange((type_count + _PACKAGE_SIZE - 1) // _PACKAGE_SIZE):
+        pkg_name = "pkg{0}".format(_get_name(pkg_idx))
+        module = types.ModuleType("synthetic.{0}_classes".format(pkg_name))
+        names = ["cls_{0}".format(_get_name(i))
+                 for i in xrange(min(_PACKAGE_SIZE, type_count - pkg_idx * _PACKAGE_SIZE))]
+        for idx, name in enumerate(names):
+            setattr(module, name, _get_function(name, {
+                'type': 'class',
+                'base': "{0}.{1}".format(pkg_name, names[idx - 1]) if idx else None,
+                'is_abstract': False,
+                'properties': [
+                    ('name', 'str', '1.1'),
+                    ('count', 'int', '0.1'),
+                    ('related', "{0}.{1}".format(pkg_name, names[-1]), '0.N')
+                    ]
+                }))
+        setattr(schema, pkg_name, _get_function(pkg_name, {module}))
+
+    return schema
+
+
+def _time(schema, number):
+    """Returns mean validation time in milliseconds."""
+    return min(timeit.repeat(lambda: validate(schema), number=number, repeat=3)) / number * 1000
+
+
+def _main(args):
+    """Main entry point.
+
+    """
+    schemas = [get_schema('cim', '1'), get_schema('cim', '2')]
+    schemas += [_get_synthetic_schema(int(i)) for i in args.sizes.split(",")]
+
+    print "{0}{1}{2}{3}".format("".ljust(16), "types".rjust(8), "elapsed (ms)".rjust(14), "per type (us)".rjust(16))
+    for schema in schemas:
+        report = validate(schema)
+        assert not report, report
+        type_count = len(ValidationContext(schema).types)
+        elapsed = _time(schema, args.number)
+
+        print "{0}{1:8}{2:14.2f}{3:16.1f}".format(
+            "{0} v{1}".format(schema.NAME, schema.VERSION).ljust(16), type_count, elapsed, elapsed * 1000 / type_count)
+
+
+# Entry point.
+if __name__ == '__main__':
+    _main(_ARGS.parse_args())
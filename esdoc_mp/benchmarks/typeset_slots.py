@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: esdoc_mp.benchmarks.typeset_slots.py
+   :platform: Unix, Windows
+   :synopsis: Memory benchmark of generated typeset classes with & without __slots__.
+
+.. moduleauthor:: Mark Conway-Greenslade <momipsl@ipsl.jussieu.fr>
+
+
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from esdoc_mp.ontologies.generators import generate
+from esdoc_mp.ontologies.schemas import get_schema
+
+
+
+# Define command line options.
+_ARGS = argparse.ArgumentParser("Benchmarks instance footprint of generated typeset classes with & without __slots__.")
+_ARGS.add_argument(
+    "-s", "--schema",
+    help="Name of ontology schema whose typeset is benchmarked.",
+    dest="schema",
+    type=str,
+    default="cim"
+    )
+_ARGS.add_argument(
+    "-v", "--version",
+    help="Version of ontology schema whose typeset is benchmarked.",
+    dest="version",
+    type=str,
+    default="2"
+    )
+_ARGS.add_argument(
+    "-n", "--number",
+    help="Number of instances created per entity class.",
+    dest="number",
+    type=int,
+    default=10000
+    )
+
+# Script measuring instance footprint within a fresh interpreter, i.e. generated modules do not collide.
+_MEASURE = """
+import gc, json, resource, sys, time
+sys.path.insert(0, sys.argv[1])
+import typeset
+
+def sizeof(o):
+    return sys.getsizeof(o) + (sys.getsizeof(o.__dict__) if hasattr(o, '__dict__') else 0)
+
+entities = [getattr(typeset, n) for n in sys.argv[3].split(',')]
+count = int(sys.argv[2])
+gc.collect()
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.time()
+instances = [cls() for cls in entities for _ in xrange(count)]
+elapsed = time.time() - start
+print json.dumps({
+    'instances': len(instances),
+    'instance_bytes': sum(sizeof(cls()) for cls in entities) / float(len(entities)),
+    'rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss,
+    'ctor_us': elapsed / len(instances) * 1e6
+    })
+"""
+
+
+def _get_entity_names(schema):
+    """Returns names of schema entity classes as exposed by the generated typeset module.
+
+    """
+    from esdoc_mp.ontologies.core import create_ontology
+    from esdoc_mp.ontologies.generators.python import utils as pgu
+
+    ontology = create_ontology(schema)
+    pgu.format(ontology)
+
+    return sorted(c.op_name for c in ontology.entities)
+
+
+def _measure(schema, slots, number):
+    """Generates a typeset & measures instance footprint within a sub-process.
+
+    """
+    io_dir = tempfile.mkdtemp()
+    try:
+        generate(schema, 'python', io_dir, options={'slots': slots})
+        typeset_dir = os.path.join(io_dir, schema.NAME, "v{0}".format(schema.VERSION.split('.')[0]))
+
+        return json.loads(subprocess.check_output([
+            sys.executable, '-c', _MEASURE, typeset_dir, str(number), ",".join(_get_entity_names(schema))
+            ]))
+    finally:
+        shutil.rmtree(io_dir)
+
+
+def _main(args):
+    """Main entry point.
+
+    """
+    schema = get_schema(args.schema, args.version)
+    results = [(label, _measure(schema, slots, args.number))
+               for label, slots in (("__dict__", False), ("__slots__", True))]
+
+    print "{0} v{1} :: {2} instances per entity class".format(schema.NAME, schema.VERSION, args.number)
+    print "{0}{1}{2}{3}".format("".ljust(12), "bytes/instance".rjust(16), "max rss (MB)".rjust(16), "ctor (us)".rjust(12))
+    for label, stats in results:
+        print "{0}{1:16.1f}{2:16.1f}{3:12.2f}".format(
+            label.ljust(12), stats['instance_bytes'], stats['rss_kb'] / 1024.0, stats['ctor_us'])
+
+
+# Entry point.
+if __name__ == '__main__':
+    _main(_ARGS.parse_args())
@@ -0,0 +1,82 @@
+"""
+.. module:: esdoc_mp.diff.py
+   :license: GPL/CeCIL
+   :platform: Unix, Windows
+   :synopsis: Prints structural diff between two ontology schemas, e.g. successive cim v2 snapshots.
+
+.. moduleauthor:: Mark Conway-Greenslade <momipsl@ipsl.jussieu.fr>
+
+
+"""
+import argparse
+import imp
+import json
+import os
+
+import esdoc_mp as mp
+
+
+
+# Define command line arguments.
+_parser = argparse.ArgumentParser("ES-DOC Ontology Diff.")
+_parser.add_argument(
+    "-l", "--left",
+    help="Previous schema, either name:version (e.g. cim:2) or path to a schema package directory.",
+    dest="left",
+    type=str
+    )
+_parser.add_argument(
+    "-r", "--right",
+    help="Current schema, either name:version (e.g. cim:2) or path to a schema package directory.",
+    dest="right",
+    type=str
+    )
+_parser.add_argument(
+    "--json",
+    help="Print diff as JSON.",
+    dest="json",
+    action="store_true"
+    )
+_parser.add_argument(
+    "--types",
+    help="Print fully qualified names of added, removed & changed types only (doc string changes are ignored).",
+    dest="types",
+    action="store_true"
+    )
+
+
+def _get_schema(spec, alias):
+    """Returns schema referenced either by name:version or by path to a schema package.
+
+    """
+    if os.path.isdir(spec):
+        return imp.load_package("_esdoc_mp_diff_{0}".format(alias), os.path.abspath(spec))
+
+    name, _, version = spec.partition(":")
+    try:
+        return mp.get_schema(name, version)
+    except KeyError:
+        raise mp.exceptions.UnsupportedOntologySchema('Unsupported schema: {0} v{1}.'.format(name, version))
+
+
+def _main(args):
+    """Main entry point.
+
+    """
+    diff = mp.diff_ontologies(mp.get_ontology(_get_schema(args.left, 'left')),
+                              mp.get_ontology(_get_schema(args.right, 'right')))
+
+    if args.json:
+        print json.dumps(diff.to_dict(), indent=4, separators=(',', ': '), sort_keys=True)
+    elif args.types:
+        for type_name in diff.changed_types:
+            print type_name
+    else:
+        print diff
+        for change in diff:
+            print change
+
+
+# Entry point.
+if __name__ == '__main__':
+    _main(_parser.parse_args())
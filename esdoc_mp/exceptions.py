@@ -12,4 +12,9 @@
 
 # Unsupported schema error.
 class UnsupportedOntologySchema(ValueError):
-    pass
\ No newline at end of file
+    pass
+
+
+# Invalid schema error.
+class InvalidOntologySchema(ValueError):
+    pass
@@ -13,6 +13,8 @@ from esdoc_mp.ontologies.core.class_constraint import ClassConstraint
 from esdoc_mp.ontologies.core.class_pstr import ClassPrintString
 from esdoc_mp.ontologies.core.computed_property import ComputedProperty
 from esdoc_mp.ontologies.core.decoding import Decoding
+from esdoc_mp.ontologies.core.diff import diff_ontologies
+from esdoc_mp.ontologies.core.diff import get_fingerprints
 from esdoc_mp.ontologies.core.enum import Enum
 from esdoc_mp.ontologies.core.enum_member import EnumMember
 from esdoc_mp.ontologies.core.ontology import Ontology
@@ -70,6 +70,14 @@ class Class(object):
         self.op_name = None
         self.properties = sorted(properties, key=lambda p: p.name)
         self.package = None
+        self.type_id = None
+
+        # Inheritance closures (set once the ontology is fully initialised).
+        self._all_computed_properties = None
+        self._all_constraints = None
+        self._all_decodings = None
+        self._all_properties = None
+        self._property_decodings = None
 
 
     def __repr__(self):
@@ -128,6 +136,9 @@ class Class(object):
         Note that child constraints overrides parent constraints.
 
         """
+        if self._all_constraints is not None:
+            return self._all_constraints
+
         result = defaultdict(lambda: defaultdict(list))
 
         # Own constraints.
@@ -148,7 +159,7 @@ class Class(object):
             if p.name not in result['type']:
                 result['type'][p.name] = (p.name, "type", p.type)
 
-        return list(itertools.chain.from_iterable([v.values() for v in result.values()]))
+        return tuple(itertools.chain.from_iterable([v.values() for v in result.values()]))
 
 
     @property
@@ -156,9 +167,11 @@ class Class(object):
         """Gets all associated properties including those of base class (sorted by name).
 
         """
+        if self._all_properties is not None:
+            return self._all_properties
         if self.base:
-            return self.properties + self.base.all_properties
-        return self.properties
+            return tuple(self.properties) + self.base.all_properties
+        return tuple(self.properties)
 
 
     @property
@@ -168,7 +181,7 @@ class Class(object):
         """
         if self.base:
             return self.base.all_properties
-        return []
+        return tuple()
 
 
     @property
@@ -176,9 +189,11 @@ class Class(object):
         """Gets all associated computed properties including those of base class (sorted by name).
 
         """
+        if self._all_computed_properties is not None:
+            return self._all_computed_properties
         if self.base:
-            return self.computed_properties + self.base.all_computed_properties
-        return self.computed_properties
+            return tuple(self.computed_properties) + self.base.all_computed_properties
+        return tuple(self.computed_properties)
 
 
     @property
@@ -186,9 +201,26 @@ class Class(object):
         """Gets class plus base class decodings.
 
         """
+        if self._all_decodings is not None:
+            return self._all_decodings
         if self.base:
-            return self.decodings + self.base.all_decodings
-        return self.decodings
+            return tuple(self.decodings) + self.base.all_decodings
+        return tuple(self.decodings)
+
+
+    def set_inheritance_closures(self):
+        """Sets properties, computed properties, constraints & decodings inherited from base classes.
+
+        Note that base class closures are expected to have been set beforehand.
+
+        """
+        self._all_properties = self.all_properties
+        self._all_computed_properties = self.all_computed_properties
+        self._all_constraints = self.all_constraints
+        self._all_decodings = self.all_decodings
+        self._property_decodings = defaultdict(tuple)
+        for dc in self._all_decodings:
+            self._property_decodings[dc.property_name] += (dc, )
 
 
     def get_property_decodings(self, prp):
@@ -197,7 +229,9 @@ class Class(object):
         :param esdoc_mp.ontologies.core.Property prp: A property being processed.
 
         """
-        return [dc for dc in self.all_decodings if dc.property_name == prp.name]
+        if self._property_decodings is not None:
+            return self._property_decodings.get(prp.name, tuple())
+        return tuple(dc for dc in self.all_decodings if dc.property_name == prp.name)
 
 
     def get_property(self, name):
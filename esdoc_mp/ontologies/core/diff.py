@@ -0,0 +1,346 @@
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: esdoc_mp.ontologies.core.diff
+   :platform: Unix, Windows
+   :synopsis: Structural diff between two ontologies, e.g. successive versions of a schema.
+
+.. moduleauthor:: Mark Conway-Greenslade <momipsl@ipsl.jussieu.fr>
+
+
+"""
+import weakref
+
+from esdoc_mp import utils
+from esdoc_mp.ontologies.core import constants
+from esdoc_mp.ontologies.core.class_ import Class
+
+
+
+# Change kinds.
+ADDED = 'added'
+CHANGED = 'changed'
+REMOVED = 'removed'
+
+# Change kind symbols used when printing a change.
+_SYMBOLS = {
+    ADDED: '+',
+    CHANGED: '~',
+    REMOVED: '-'
+}
+
+# Map of ontology -> fingerprints (memoized as ontologies are immutable once initialised).
+_FINGERPRINTS = weakref.WeakKeyDictionary()
+
+
+class Change(object):
+    """A structural change between two ontologies.
+
+    :ivar str kind: Change kind, i.e. added | removed | changed.
+    :ivar str node: Type of node that has changed, i.e. package | class | enum | property | enum_member | constraint | decoding.
+    :ivar str path: Dotted path to changed node, e.g. activity.ensemble.members.
+    :ivar str attribute: Name of changed attribute (changed nodes only), e.g. cardinality.
+                         Constraints & decodings are identified by constraint type & decoded type respectively.
+    :ivar old: Previous attribute value.
+    :ivar new: Current attribute value.
+
+    """
+    def __init__(self, kind, node, path, attribute=None, old=None, new=None):
+        """Instance constructor.
+
+        """
+        self.kind = kind
+        self.node = node
+        self.path = path
+        self.attribute = attribute
+        self.old = old
+        self.new = new
+
+
+    def __repr__(self):
+        """Instance string representation.
+
+        """
+        result = "{0} {1} {2}".format(_SYMBOLS[self.kind], self.node, self.path)
+        if self.attribute is not None:
+            result += " :: {0} {1} -> {2}".format(self.attribute, self.old, self.new)
+
+        return result
+
+
+    @property
+    def type_name(self):
+        """Returns fully qualified name of type affected by change (None for package changes).
+
+        """
+        if self.node == 'package':
+            return None
+
+        return ".".join(self.path.split('.')[:2])
+
+
+    def to_dict(self):
+        """Returns a dictionary representation of the change.
+
+        """
+        return {k: v for k, v in self.__dict__.items() if v is not None}
+
+
+class OntologyDiff(object):
+    """Set of structural changes between two ontologies.
+
+    :ivar Ontology left: Previous ontology.
+    :ivar Ontology right: Current ontology.
+    :ivar list changes: Set of changes ordered by path.
+
+    """
+    def __init__(self, left, right, changes):
+        """Instance constructor.
+
+        """
+        self.left = left
+        self.right = right
+        self.changes = changes
+
+
+    def __iter__(self):
+        """Instance iterator.
+
+        """
+        return iter(self.changes)
+
+
+    def __len__(self):
+        """Returns number of changes.
+
+        """
+        return len(self.changes)
+
+
+    def __repr__(self):
+        """Instance string representation.
+
+        """
+        return "{0} -> {1} :: {2} changes".format(self.left, self.right, len(self.changes))
+
+
+    @property
+    def changed_types(self):
+        """Returns fully qualified names of types that have been added, removed or changed.
+
+        """
+        return sorted({c.type_name for c in self.changes if c.type_name is not None})
+
+
+    @property
+    def changed_packages(self):
+        """Returns names of packages that have been added, removed or whose types have changed.
+
+        """
+        return sorted({c.path.split('.')[0] for c in self.changes})
+
+
+    def to_dict(self):
+        """Returns a dictionary representation of the diff.
+
+        """
+        return {
+            'left': str(self.left),
+            'right': str(self.right),
+            'changes': [c.to_dict() for c in self.changes]
+        }
+
+
+def get_fingerprints(ontology):
+    """Returns hashed fingerprints of an ontology, its packages & types.
+
+    A node's fingerprint is derived from its own structure plus the fingerprints of its
+    child nodes, i.e. equal fingerprints imply structurally equal sub-trees.
+
+    :param Ontology ontology: An ontology.
+
+    :returns: Map of fingerprints keyed by '' (ontology), package name & fully qualified type name.
+    :rtype: dict
+
+    """
+    try:
+        return _FINGERPRINTS[ontology]
+    except KeyError:
+        pass
+
+    result = {}
+    for pkg in ontology.packages:
+        for type_ in pkg.types:
+            result[_get_type_name(type_)] = utils.get_hash("|".join(_get_type_signature(type_)))
+        result[pkg.name] = utils.get_hash("|".join(
+            [pkg.name] + [result[_get_type_name(t)] for t in sorted(pkg.types, key=lambda t: t.name)]))
+    result[''] = utils.get_hash("|".join(result[p.name] for p in ontology.packages))
+    _FINGERPRINTS[ontology] = result
+
+    return result
+
+
+def diff_ontologies(left, right):
+    """Returns structural diff between two ontologies.
+
+    Packages & types whose fingerprints are equal are skipped without being compared.
+
+    :param Ontology left: Previous ontology.
+    :param Ontology right: Current ontology.
+
+    :returns: Set of added, removed & changed packages, types, properties, enum members, constraints & decodings.
+    :rtype: OntologyDiff
+
+    """
+    left_fp, right_fp = get_fingerprints(left), get_fingerprints(right)
+    changes = []
+    if left_fp[''] != right_fp['']:
+        left_packages = {p.name: p for p in left.packages}
+        right_packages = {p.name: p for p in right.packages}
+        for name in sorted(set(left_packages) | set(right_packages)):
+            if left_fp.get(name) != right_fp.get(name):
+                changes += _diff_package(left_packages.get(name), right_packages.get(name), left_fp, right_fp)
+
+    return OntologyDiff(left, right, changes)
+
+
+def _get_type_name(type_):
+    """Returns fully qualified type name."""
+    return "{0}.{1}".format(type_.package.name, type_.name)
+
+
+def _get_node(type_):
+    """Returns node name of a type."""
+    return 'class' if isinstance(type_, Class) else 'enum'
+
+
+def _get_base_name(cls):
+    """Returns fully qualified name of a class's base class."""
+    if isinstance(cls.base, Class):
+        return _get_type_name(cls.base)
+
+    return cls.base
+
+
+def _get_attributes(type_):
+    """Returns set of compared (name, value) attributes of a type."""
+    if isinstance(type_, Class):
+        return (
+            ('base', _get_base_name(type_)),
+            ('is_abstract', type_.is_abstract),
+            ('is_document', type_.is_document)
+            )
+
+    return (
+        ('is_open', type_.is_open),
+        )
+
+
+def _get_members(type_):
+    """Returns map of a type's member name -> compared (name, value) attributes."""
+    if isinstance(type_, Class):
+        return {p.name: (('type', p.type.name), ('cardinality', p.cardinality)) for p in type_.properties}
+
+    return {m.name: () for m in type_.members}
+
+
+def _get_constraints(type_):
+    """Returns map of a class's (property name, constraint type) -> constraint value, e.g. constants."""
+    if not isinstance(type_, Class):
+        return {}
+
+    # N.B. schemas declare constraints as either (property, type, value) or (type, property, value).
+    result = {}
+    for ct in type_.constraints:
+        if ct.property_name in constants.CONSTRAINT_TYPES:
+            result[(ct.typeof, ct.property_name)] = ct.value
+        else:
+            result[(ct.property_name, ct.typeof)] = ct.value
+
+    return result
+
+
+def _get_decodings(type_):
+    """Returns map of a class's (property name, decoded type) -> decoding xpath."""
+    if isinstance(type_, Class):
+        return {(dc.property_name, dc.type or 'decoding'): dc.decoding for dc in type_.decodings}
+
+    return {}
+
+
+def _get_type_signature(type_):
+    """Returns set of strings whose hash is a type's fingerprint."""
+    result = [_get_node(type_), type_.name]
+    result += ["{0}={1}".format(k, v) for k, v in _get_attributes(type_)]
+    for name, attributes in sorted(_get_members(type_).items()):
+        result.append(",".join([name] + ["{0}={1}".format(k, v) for k, v in attributes]))
+    for node, items in (('constraint', _get_constraints(type_)), ('decoding', _get_decodings(type_))):
+        for (name, attribute), value in sorted(items.items()):
+            result.append("{0}:{1}.{2}={3}".format(node, name, attribute, repr(value)))
+
+    return result
+
+
+def _diff_package(left, right, left_fp, right_fp):
+    """Returns changes between two versions of a package."""
+    if left is None:
+        return [Change(ADDED, 'package', right.name)] + \
+               [Change(ADDED, _get_node(t), _get_type_name(t)) for t in right.types]
+    if right is None:
+        return [Change(REMOVED, 'package', left.name)] + \
+               [Change(REMOVED, _get_node(t), _get_type_name(t)) for t in left.types]
+
+    left_types = {_get_type_name(t): t for t in left.types}
+    right_types = {_get_type_name(t): t for t in right.types}
+    changes = []
+    for name in sorted(set(left_types) | set(right_types)):
+        if left_fp.get(name) != right_fp.get(name):
+            changes += _diff_type(left_types.get(name), right_types.get(name))
+
+    return changes
+
+
+def _diff_type(left, right):
+    """Returns changes between two versions of a type."""
+    if left is None:
+        return [Change(ADDED, _get_node(right), _get_type_name(right))]
+    if right is None:
+        return [Change(REMOVED, _get_node(left), _get_type_name(left))]
+
+    name = _get_type_name(right)
+    node = _get_node(right)
+    if node != _get_node(left):
+        return [Change(CHANGED, node, name, 'node', _get_node(left), node)]
+
+    # Type attributes.
+    changes = [Change(CHANGED, node, name, k, v, new)
+               for (k, v), (_, new) in zip(_get_attributes(left), _get_attributes(right)) if v != new]
+
+    # Type members, i.e. properties | enum members.
+    member_node = 'property' if node == 'class' else 'enum_member'
+    left_members, right_members = _get_members(left), _get_members(right)
+    for member in sorted(set(left_members) | set(right_members)):
+        path = "{0}.{1}".format(name, member)
+        if member not in left_members:
+            changes.append(Change(ADDED, member_node, path))
+        elif member not in right_members:
+            changes.append(Change(REMOVED, member_node, path))
+        else:
+            changes += [Change(CHANGED, member_node, path, k, v, new)
+                        for (k, v), (_, new) in zip(left_members[member], right_members[member]) if v != new]
+
+    # Class constraints (e.g. constants) & decodings.
+    for node, left_items, right_items in (
+        ('constraint', _get_constraints(left), _get_constraints(right)),
+        ('decoding', _get_decodings(left), _get_decodings(right))
+        ):
+        for key in sorted(set(left_items) | set(right_items)):
+            path = "{0}.{1}".format(name, key[0])
+            if key not in left_items:
+                changes.append(Change(ADDED, node, path, key[1], new=right_items[key]))
+            elif key not in right_items:
+                changes.append(Change(REMOVED, node, path, key[1], old=left_items[key]))
+            elif left_items[key] != right_items[key]:
+                changes.append(Change(CHANGED, node, path, key[1], left_items[key], right_items[key]))
+
+    return changes
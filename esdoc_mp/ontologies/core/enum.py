@@ -28,6 +28,7 @@ class Enum(object):
         self.doc_string = doc_string if doc_string is not None else ''
         self.members = sorted(members, key=lambda m: m.name)
         self.package = None
+        self.type_id = None
 
         self.op_doc_string_name = None
         self.op_file_name = None
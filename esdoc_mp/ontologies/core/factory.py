@@ -12,6 +12,7 @@
 import inspect
 import re
 
+from esdoc_mp import profiling
 from esdoc_mp.ontologies.core import Class
 from esdoc_mp.ontologies.core import ClassConstraint
 from esdoc_mp.ontologies.core import ClassPrintString
@@ -217,6 +218,7 @@ def _get_ontology_packages(schema):
     return result
 
 
+@profiling.timed('ontology')
 def create_ontology(schema):
     """Factory method to instantiate an ontology instance from a schema declaration.
 
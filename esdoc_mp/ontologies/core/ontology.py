@@ -13,6 +13,7 @@ from operator import add
 from functools import reduce
 
 from esdoc_mp.ontologies.core.class_ import Class
+from esdoc_mp import profiling
 from esdoc_mp import utils
 
 
@@ -31,6 +32,7 @@ class Ontology(object):
 
         """
         self.classes = reduce(add, [p.classes for p in packages])
+        self.class_properties = {}
         self.decodings = reduce(add, [p.decodings for p in packages])
         self.doc_string = doc_string
         self.entities = []
@@ -43,12 +45,15 @@ class Ontology(object):
         self.properties = reduce(add, [c.properties for c in self.classes])
         self.property_types = [p.type for p in self.properties]
         self.sub_classed = tuple()
+        self.sub_class_closures = {}
         self.types = sorted(self.classes + self.enums)
+        self.types_by_name = {}
         self.version = version
 
         # Set derived information.
         for setter in [
             _set_relations,
+            _set_type_index,
             _set_base_classes,
             _set_sub_classes,
             _set_entities,
@@ -59,8 +64,11 @@ class Ontology(object):
             _set_associated_packages_for_import,
             _set_package_external_type_refs,
             _set_collection_sort_orders,
+            _set_class_inheritance_closures,
+            _set_type_indexes,
         ]:
-            setter(self)
+            with profiling.timer('ontology.{0}'.format(setter.__name__)):
+                setter(self)
 
 
     def __repr__(self):
@@ -73,14 +81,13 @@ class Ontology(object):
     def get_type(self, name):
         """Returns type with matching name.
 
+        N.B. types are looked up via types_by_name, which is built once by _set_type_index
+        during construction, i.e. it is not updated if types are subsequently added or renamed.
+
         :param str name: Fully qualified name of target type.
 
         """
-        pkg_name = name.split('.')[0]
-        type_name = name.split('.')[1]
-        for t in self.types:
-            if t.package.name == pkg_name and t.name == type_name:
-                return t
+        return self.types_by_name.get(name)
 
 
 def _set_relations(ontology):
@@ -100,6 +107,16 @@ def _set_relations(ontology):
                 enum_member.enum = enum
 
 
+def _set_type_index(ontology):
+    """Sets index of types keyed by fully qualified name.
+
+    N.B. runs after _set_relations (as type package names are required) & before any setter
+    calling get_type, the index is empty prior to this setter & is not maintained thereafter.
+
+    """
+    ontology.types_by_name = {"{}.{}".format(t.package.name, t.name): t for t in ontology.types}
+
+
 def _set_base_classes(ontology):
     """Sets base classes.
 
@@ -236,3 +253,27 @@ def _set_collection_sort_orders(ontology):
     ontology.enum_members = sorted(ontology.enum_members, key=str)
     ontology.entities = sorted(ontology.entities, key=str)
     ontology.properties = sorted(ontology.properties, key=str)
+
+
+def _set_class_inheritance_closures(ontology):
+    """Sets class inheritance closures (base classes are processed before their sub-classes).
+
+    """
+    for cls in sorted(ontology.classes, key=lambda c: len(c.bases)):
+        cls.set_inheritance_closures()
+
+
+def _set_type_indexes(ontology):
+    """Sets type lookup indexes, i.e. type identifiers, class properties & sub-class closures.
+
+    """
+    for type_id, type_ in enumerate(ontology.types):
+        type_.type_id = type_id
+
+    # N.B. sub-class properties override those inherited from base classes.
+    for cls in ontology.classes:
+        for prp in cls.all_properties:
+            ontology.class_properties.setdefault((cls, prp.name), prp)
+
+    for cls in ontology.classes:
+        ontology.sub_class_closures[cls] = frozenset((cls, ) + tuple(cls.sub_classes))
@@ -12,6 +12,7 @@
 import inspect
 import re
 
+from esdoc_mp import profiling
 from esdoc_mp.ontologies.core.schema_validation.context import ValidationContext
 from esdoc_mp.ontologies.core.schema_validation import class_validator
 from esdoc_mp.ontologies.core.schema_validation import enum_validator
@@ -30,13 +31,15 @@ def validate(schema):
     :rtype: set
 
     """
-    ctx = ValidationContext(schema)
+    with profiling.timer('validate.context'):
+        ctx = ValidationContext(schema)
     for validator in (
         schema_validator,
         package_validator,
         type_validator
         ):
-        validator.validate(ctx)
+        with profiling.timer('validate.{0}'.format(validator.__name__.split('.')[-1])):
+            validator.validate(ctx)
         if ctx.report:
             break
 
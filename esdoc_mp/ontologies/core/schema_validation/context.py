@@ -10,12 +10,16 @@
 
 """
 import inspect
+import sys
 
 
 
 class ValidationContext(object):
     """Encapsulates schema validation processing information.
 
+    The schema is introspected once upon instantiation, i.e. each factory is invoked
+    a single time and the resulting (immutable) snapshot is shared by all validators.
+
     """
     def __init__(self, schema):
         """Instance constructor.
@@ -24,6 +28,26 @@ class ValidationContext(object):
         self.schema = schema
         self.report = list()
 
+        # Cache of module functions.
+        self._functions = {}
+
+        # Cache of factory invocation results, i.e. factory -> (instance, exc_info).
+        self._invocations = {}
+
+        # Set schema snapshot.
+        self._package_factories = self.get_functions(self.schema)
+        self._packages = self._get_packages()
+        self._type_modules = self._get_type_modules()
+        self._type_factories = self._get_type_factories()
+        self._types = self._get_types()
+        self._classes = tuple(t for t in self._types
+                              if 'type' in t[2] and t[2]['type'] == 'class')
+        self._enums = tuple(t for t in self._types
+                            if 'type' in t[2] and t[2]['type'] == 'enum')
+        self._types_by_name = {self.get_type_name(t[1], t[0]): t for t in self._types}
+        self._valid_types = frozenset(self._types_by_name)
+        self._valid_classes = frozenset(self.get_type_name(t[1], t[0]) for t in self._classes)
+
 
     def set_error(self, err):
         """Adds an error to the manged collection.
@@ -53,7 +77,7 @@ class ValidationContext(object):
         """Gets package factories.
 
         """
-        return self.get_functions(self.schema)
+        return self._package_factories
 
 
     @property
@@ -61,14 +85,7 @@ class ValidationContext(object):
         """Gets package definitions.
 
         """
-        result = list()
-        for factory in self.package_factories:
-            try:
-                result.append((factory, factory()))
-            except Exception as err:
-                pass
-
-        return sorted([p for p in result if isinstance(p[1], set) and len(p[1])])
+        return self._packages
 
 
     @property
@@ -76,12 +93,7 @@ class ValidationContext(object):
         """Gets type modules.
 
         """
-        result = list()
-        for factory, modules in self.packages:
-            result += [(factory, m) for m in modules
-                       if inspect.ismodule(m) and self.get_functions(m)]
-
-        return sorted(result)
+        return self._type_modules
 
 
     @property
@@ -89,11 +101,7 @@ class ValidationContext(object):
         """Gets type factories.
 
         """
-        result = list()
-        for factory, module in self.type_modules:
-            result += [(module, f) for f in self.get_functions(module)]
-
-        return sorted(result)
+        return self._type_factories
 
 
     @property
@@ -101,17 +109,15 @@ class ValidationContext(object):
         """Gets type definitions.
 
         """
-        result = list()
-        for module, factory in self.type_factories:
-            try:
-                type_ = factory()
-            except Exception as err:
-                pass
-            else:
-                if isinstance(type_, dict):
-                    result.append((module, factory, type_))
+        return self._types
 
-        return sorted(result)
+
+    @property
+    def types_by_name(self):
+        """Gets type definitions keyed by qualified type name.
+
+        """
+        return self._types_by_name
 
 
     @property
@@ -119,8 +125,7 @@ class ValidationContext(object):
         """Get class definitions.
 
         """
-        return [(t[0], t[1], t[2]) for t in self.types
-                if 'type' in t[2] and t[2]['type'] == 'class']
+        return self._classes
 
 
     @property
@@ -128,8 +133,34 @@ class ValidationContext(object):
         """Get enum definitions.
 
         """
-        return [(t[0], t[1], t[2]) for t in self.types
-                if 'type' in t[2] and t[2]['type'] == 'enum']
+        return self._enums
+
+
+    @property
+    def valid_classes(self):
+        """Gets set of valid class names.
+
+        """
+        return self._valid_classes
+
+
+    def invoke(self, factory):
+        """Returns result of invoking a factory, re-raising any error raised by the factory.
+
+        Factories are invoked once only, thereafter the cached result is returned.
+
+        """
+        if factory not in self._invocations:
+            try:
+                self._invocations[factory] = (factory(), None)
+            except Exception:
+                self._invocations[factory] = (None, sys.exc_info())
+
+        instance, exc_info = self._invocations[factory]
+        if exc_info is not None:
+            raise exc_info[0], exc_info[1], exc_info[2]
+
+        return instance
 
 
     def get_name(self, factory, module=None):
@@ -177,11 +208,69 @@ class ValidationContext(object):
         """Returns a collection of function pointers declared within a module.
 
         """
-        return sorted({ m[1] for m in inspect.getmembers(module) if inspect.isfunction(m[1]) })
+        if module not in self._functions:
+            self._functions[module] = tuple(sorted(
+                { m[1] for m in inspect.getmembers(module) if inspect.isfunction(m[1]) }))
+
+        return self._functions[module]
 
 
     def get_valid_types(self):
         """Return set of valid types.
 
         """
-        return [self.get_type_name(defn[1], defn[0]) for defn in self.types]
+        return self._valid_types
+
+
+    def _get_packages(self):
+        """Returns package definitions.
+
+        """
+        result = list()
+        for factory in self.package_factories:
+            try:
+                result.append((factory, self.invoke(factory)))
+            except Exception as err:
+                pass
+
+        return tuple(sorted([p for p in result if isinstance(p[1], set) and len(p[1])]))
+
+
+    def _get_type_modules(self):
+        """Returns type modules.
+
+        """
+        result = list()
+        for factory, modules in self.packages:
+            result += [(factory, m) for m in modules
+                       if inspect.ismodule(m) and self.get_functions(m)]
+
+        return tuple(sorted(result))
+
+
+    def _get_type_factories(self):
+        """Returns type factories.
+
+        """
+        result = list()
+        for factory, module in self.type_modules:
+            result += [(module, f) for f in self.get_functions(module)]
+
+        return tuple(sorted(result))
+
+
+    def _get_types(self):
+        """Returns type definitions.
+
+        """
+        result = list()
+        for module, factory in self.type_factories:
+            try:
+                type_ = self.invoke(factory)
+            except Exception as err:
+                pass
+            else:
+                if isinstance(type_, dict):
+                    result.append((module, factory, type_))
+
+        return tuple(sorted(result))
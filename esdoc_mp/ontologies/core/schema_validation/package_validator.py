@@ -23,7 +23,7 @@ def _validate_factory(ctx, module, factory, expected_type, type_description):
 
     """
     try:
-        instance = factory()
+        instance = ctx.invoke(factory)
     except Exception as error:
         err = 'Invalid {0}: {1} --> type creation error occurred (type must be declared as a no-arg callable): {2}'
         err = err.format(type_description, ctx.get_name(factory, module), error)
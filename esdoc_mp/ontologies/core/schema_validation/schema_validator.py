@@ -24,7 +24,7 @@ def _validate_package_factory(ctx, module, factory, expected_type, type_descript
 
     """
     try:
-        instance = factory()
+        instance = ctx.invoke(factory)
     except:
         err = 'Invalid {0}: {1} --> must be a no-arg callable'
         err = err.format(type_description, ctx.get_name(factory, module))
@@ -26,11 +26,8 @@ def _validate_base_class_references(ctx):
     """Validates base class references.
 
     """
-    valid_classes = [ctx.get_type_name(factory, module)
-                     for module, factory, cls in ctx.classes]
-
     for module, factory, cls in ctx.classes:
-        if 'base' in cls and cls['base'] is not None and cls['base'] not in valid_classes:
+        if 'base' in cls and cls['base'] is not None and cls['base'] not in ctx.valid_classes:
             err = 'Invalid class: {0} --> base class "{1}" is unrecognized'
             err = err.format(ctx.get_name(factory, module), cls['base'])
             ctx.set_error(err)
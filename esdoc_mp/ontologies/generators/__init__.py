@@ -8,29 +8,53 @@
 
 
 """
+import contextlib
+import importlib
+import multiprocessing
 import os
+import time
 
+from esdoc_mp import profiling
 from esdoc_mp import utils
+from esdoc_mp.exceptions import InvalidOntologySchema
 from esdoc_mp.ontologies.core.factory import create_ontology
 from esdoc_mp.ontologies.core.schema_validation import validate as validate_schema
 from esdoc_mp.ontologies.generators import generator_utils as gu
 from esdoc_mp.ontologies.generators import python
 from esdoc_mp.ontologies.generators import qxml
 from esdoc_mp.ontologies.generators.generator_context import GeneratorContext
+from esdoc_mp.ontologies.generators.manifest import Manifest
+from esdoc_mp.ontologies.generators.output_sink import FileSystemSink
+from esdoc_mp.ontologies.generators.output_sink import MemorySink
+from esdoc_mp.ontologies.generators.output_sink import OutputSink
+from esdoc_mp.ontologies.generators.output_sink import ZipSink
 
 
 # Map of generator handlers.
 _HANDLERS = { i.__name__.split('.')[-1]: i for i in (python, qxml) }
 
+# State shared by generators executing within a worker process.
+_WORKER_STATE = {}
 
-def _log_start(schema, language, io_dir):
+
+def _log_start(schema, language, io_dir, options=None):
     """Informs user that generation is about to begin.
 
     """
     utils.log("Welcome to the ES-DOC meta-programming code generator !")
     utils.log("GENERATION OPTION : ontology schema = {0} v{1}".format(schema.NAME, schema.VERSION))
     utils.log("GENERATION OPTION : programming language = {0}".format(language))
-    utils.log("GENERATION OPTION : output directory = {0}".format(io_dir))
+    utils.log("GENERATION OPTION : output directory = {0}".format(io_dir or "(in memory)"))
+    _log_options(options)
+
+
+def _log_options(options):
+    """Informs user of active generator options.
+
+    """
+    for key, value in sorted((options or {}).items()):
+        if value:
+            utils.log("GENERATION OPTION : {0} = {1}".format(key, value))
 
 
 def _log_end():
@@ -45,7 +69,7 @@ def _can_generate(schema, language, output_dir):
 
     :param module schema: Ontology schema definition.
     :param str language: Target programming language.
-    :param str io_dir: Target I/O directory.
+    :param str io_dir: Target I/O directory (None if generating in memory).
 
     :returns: True if generation can occur, False otherwise.
     :rtype: bool
@@ -55,7 +79,7 @@ def _can_generate(schema, language, output_dir):
         err = "Programming language is unsupported [{}].  Supported languages are {}."
         err = err.format(language, _HANDLERS.keys())
         raise ValueError(err)
-    if not os.path.exists(output_dir):
+    if output_dir is not None and not os.path.exists(output_dir):
         raise IOError("Output directory does not exist [{0}].".format(output_dir))
 
     errors = validate_schema(schema)
@@ -68,18 +92,57 @@ def _can_generate(schema, language, output_dir):
     return True
 
 
+def _get_generator_key(generator):
+    """Returns key of either a tornado template or parser based generator.
+
+    """
+    return generator if isinstance(generator, str) else generator.__name__
+
+
+def _get_generators(language):
+    """Returns set of language specific generators (in a deterministic order).
+
+    """
+    return sorted(_HANDLERS[language].GENERATORS, key=_get_generator_key)
+
+
+def _format_ontology(ontology, language):
+    """Applies language specific pre-generator formatter.
+
+    :returns: True if the ontology was formatted, False otherwise.
+    :rtype: bool
+
+    """
+    try:
+        formatter = _HANDLERS[language].UTILS.format
+    except AttributeError:
+        return False
+    else:
+        with profiling.timer('format'):
+            formatter(ontology)
+        return True
+
+
 def _generate_from_template(ctx, template):
     """Generates code from a tornado template.
 
     """
     lu = _HANDLERS[ctx.language].UTILS
+    try:
+        if not lu.is_template_required(ctx, template):
+            return False
+    except AttributeError:
+        pass
+
     utils.log("GENERATOR = {0} :: generation begins".format(ctx.key))
-    code = ctx.get_code(template, lu)
+    with profiling.timer('generator.{0}.template'.format(ctx.key)):
+        code = ctx.get_code(template, lu)
     if code:
-        gu.write_file(gu.format_code(ctx, code),
-                      lu.get_ontology_directory(ctx),
-                      lu.get_module_file_name(template.split('.')[0]))
-    utils.log("GENERATOR = {0} :: generation complete".format(ctx.key))
+        ctx.code.append((code,
+                         lu.get_ontology_directory(ctx),
+                         lu.get_module_file_name(template.split('.')[0])))
+
+    return True
 
 
 def _generate_from_parser(ctx, parser_type):
@@ -88,46 +151,408 @@ def _generate_from_parser(ctx, parser_type):
     """
     parser = parser_type()
     if not parser.is_required(ctx):
-        utils.log("GENERATOR = {0} :: generation skipped".format(ctx.key))
-    else:
-        utils.log("GENERATOR = {0} :: generation begins".format(ctx.key))
-        parser.execute(ctx)
-        for code, dir_, fpath in ctx.code:
-            gu.write_file(gu.format_code(ctx, code), dir_, fpath)
-        utils.log("GENERATOR = {0} :: generation complete".format(ctx.key))
+        return False
+    utils.log("GENERATOR = {0} :: generation begins".format(ctx.key))
+    parser.execute(ctx)
+
+    return True
 
 
-def generate(schema, language, io_dir):
-    """Generates code.
+def _execute_generator(generator, ontology, language, io_dir, options=None):
+    """Executes a generator.
+
+    :returns: Generator key, executed flag, set of code files (formatted lazily, i.e. as each is written) & elapsed time.
+    :rtype: tuple
+
+    """
+    start = time.time()
+    ctx = GeneratorContext(generator, ontology, language, io_dir, options)
+    func = _generate_from_template if isinstance(generator, str) else _generate_from_parser
+    executed = func(ctx, generator)
+
+    return ctx.key, executed, _format_generator_output(ctx), time.time() - start
+
+
+def _format_generator_output(ctx):
+    """Yields formatted code files of an executed generator.
+
+    """
+    for code, dir_, fpath in ctx.code:
+        yield gu.format_code(ctx, code), dir_, fpath
+
+
+def _set_worker_state(schema_name, ontology, language, io_dir, options):
+    """Sets state shared by generators executing within a worker process.
+
+    """
+    _WORKER_STATE.update({
+        'generators': {_get_generator_key(g): g for g in _get_generators(language)},
+        'io_dir': io_dir,
+        'language': language,
+        'ontology': ontology,
+        'options': options,
+        'schema_name': schema_name
+        })
+
+
+def _init_worker(schema_name, language, io_dir, options):
+    """Initialises a generation worker process.
+
+    """
+    # Forked workers inherit parent state, otherwise the ontology is rebuilt.
+    if _WORKER_STATE.get('schema_name') == schema_name and \
+       _WORKER_STATE.get('language') == language:
+        return
+
+    ontology = create_ontology(importlib.import_module(schema_name))
+    _format_ontology(ontology, language)
+    _set_worker_state(schema_name, ontology, language, io_dir, options)
+
+
+def _execute_generator_in_worker(key):
+    """Executes a generator within a worker process.
+
+    :returns: Generator output plus profiling stats collected whilst executing.
+    :rtype: tuple
+
+    """
+    profiling.reset()
+    start = time.time()
+    key, executed, code, _ = _execute_generator(_WORKER_STATE['generators'][key],
+                                                _WORKER_STATE['ontology'],
+                                                _WORKER_STATE['language'],
+                                                _WORKER_STATE['io_dir'],
+                                                _WORKER_STATE['options'])
+    code = list(code)
+
+    return (key, executed, code, time.time() - start), profiling.get_stats()
+
+
+def _write_generator_output(key, executed, code, elapsed, sink, manifest=None):
+    """Writes generator output to an output sink.
+
+    :param str key: Generator key.
+    :param bool executed: Flag indicating whether generator was executed.
+    :param iterable code: Set of (code, directory, file name) tuples, files are written as they are iterated.
+    :param float elapsed: Time spent executing generator prior to writing its output.
+    :param OutputSink sink: Destination of generated files.
+    :param Manifest manifest: Manifest of an incremental generation run.
+
+    """
+    if not executed:
+        utils.log("GENERATOR = {0} :: generation skipped".format(key))
+        return
+
+    start = time.time()
+    for code, dir_, fpath in code:
+        if manifest is None or \
+           manifest.is_written(key, os.path.join(dir_, fpath), gu.format_file_code(code, fpath)):
+            sink.write(code, dir_, fpath)
+    utils.log("GENERATOR = {0} :: generation complete ({1:.3f}s)".format(key, elapsed + time.time() - start))
+
+
+def _generate(schema, ontology, language, io_dir, jobs=1, incremental=False, options=None, sink=None):
+    """Generates code from an initialised ontology.
 
     :param module schema: Ontology schema definition.
+    :param esdoc_mp.ontologies.core.Ontology ontology: Ontology being processed.
     :param str language: Target programming language.
     :param str io_dir: Target I/O directory.
+    :param int jobs: Number of generators to execute concurrently.
+    :param bool incremental: Flag indicating whether unchanged output will be skipped.
+    :param dict options: Generator options, e.g. {'slots': True}.
+    :param OutputSink sink: Destination of generated files.
 
     """
-    if not _can_generate(schema, language, io_dir):
-        return
+    # Load templates up front - forked workers inherit the loaded templates.
+    gu.preload_templates(language)
 
-    _log_start(schema, language, io_dir)
+    # Apply language specific pre-generator formatter.
+    if _format_ontology(ontology, language):
+        utils.log("ONTOLOGY :: formatted for {0}".format(language))
 
-    # Initialise ontology.
-    ontology = create_ontology(schema)
-    utils.log("ONTOLOGY :: {0} (packages={1}, classes={2}, enums={3})".format(
-        ontology, len(ontology.packages), len(ontology.classes), len(ontology.enums)))
+    # Skip generators whose inputs & outputs are unchanged since previous run.
+    generators = _get_generators(language)
+    manifest = None
+    if incremental:
+        manifest = Manifest(schema, language, io_dir,
+                            os.path.dirname(_HANDLERS[language].__file__), options)
+        for generator in [g for g in generators if manifest.is_unchanged(_get_generator_key(g))]:
+            utils.log("GENERATOR = {0} :: generation skipped (unchanged)".format(_get_generator_key(generator)))
+            manifest.skip(_get_generator_key(generator))
+            generators.remove(generator)
+
+    # Invoke language specific generators - output is written in generator order, when serial
+    # each generator's output is written as soon as it has been executed.
+    if generators and jobs > 1:
+        utils.log("GENERATION OPTION : jobs = {0}".format(jobs))
+        _set_worker_state(schema.__name__, ontology, language, io_dir, options)
+        pool = multiprocessing.Pool(min(jobs, len(generators)),
+                                    _init_worker,
+                                    (schema.__name__, language, io_dir, options))
+        try:
+            keys = [_get_generator_key(g) for g in generators]
+            for output, stats in pool.imap(_execute_generator_in_worker, keys):
+                profiling.merge(stats)
+                _write_generator_output(*output, manifest=manifest, sink=sink)
+        finally:
+            pool.close()
+            pool.join()
+            _WORKER_STATE.clear()
+    else:
+        for generator in generators:
+            _write_generator_output(*_execute_generator(generator, ontology, language, io_dir, options),
+                                    manifest=manifest, sink=sink)
 
-    # Apply language specific pre-generator formatter.
-    try:
-        formatter = _HANDLERS[language].UTILS.format
-    except AttributeError:
-        pass
+    # Update manifest.
+    if manifest is not None:
+        manifest.save()
+        utils.log("INCREMENTAL GENERATION :: files written={0}, skipped={1}, deleted={2}".format(
+            manifest.written, manifest.skipped, manifest.deleted))
+
+
+def _generate_batch_item(args, sink=None):
+    """Generates code for a single schema across a set of languages.
+
+    :param tuple args: Schema module name, target programming languages, target I/O directory, incremental flag, generator options, number of writer threads.
+    :param OutputSink sink: Destination of generated files (defaults to file system).
+
+    :returns: Schema label & set of (stage, elapsed time) timings.
+    :rtype: tuple
+
+    """
+    schema_name, languages, io_dir, incremental, options, write_jobs = args
+    timings = []
+
+    def _timed(stage, func, *args):
+        start = time.time()
+        result = func(*args)
+        timings.append((stage, time.time() - start))
+        return result
+
+    schema = _timed('import', importlib.import_module, schema_name)
+    label = "{0} v{1}".format(schema.NAME, schema.VERSION)
+    errors = _timed('validate', validate_schema, schema)
+    if errors:
+        utils.log("-------------------------------------------------------------------")
+        for error in errors:
+            utils.log("VALIDATION ERROR :: {0} :: {1}".format(label, error))
+        return label, timings
+
+    ontology = _timed('ontology', create_ontology, schema)
+    with _open_sink(io_dir, sink, write_jobs) as sink:
+        for language in languages:
+            with profiling.scope(language):
+                _timed(language, _generate, schema, ontology, language, io_dir, 1, incremental, options, sink)
+
+    return label, timings
+
+
+def _generate_batch_item_in_worker(args):
+    """Generates code for a single schema across a set of languages within a worker process.
+
+    :returns: Batch item result plus profiling stats collected whilst generating.
+    :rtype: tuple
+
+    """
+    profiling.reset()
+    with profiling.scope(_get_profiling_scope(args[0])):
+        result = _generate_batch_item(args)
+
+    return result, profiling.get_stats()
+
+
+@contextlib.contextmanager
+def _open_sink(io_dir, sink=None, write_jobs=0):
+    """Yields sink to which generated files are written, pending writes are flushed upon exit.
+
+    :param str io_dir: Target I/O directory.
+    :param OutputSink sink: Destination of generated files, if None a file system sink is opened & closed.
+    :param int write_jobs: Number of writer threads of an opened file system sink.
+
+    """
+    if sink is not None:
+        yield sink
+        sink.flush()
     else:
-        formatter(ontology)
-        utils.log("ONTOLOGY :: formatted for {0}".format(language))
+        with FileSystemSink(io_dir, write_jobs) as sink:
+            yield sink
+
+
+def _validate_sink(io_dir, sink, incremental):
+    """Validates that generated files have a destination which supports the requested generation mode.
+
+    """
+    if io_dir is None and sink is None:
+        raise ValueError("An output directory or an output sink is required.")
+    if incremental and io_dir is None:
+        raise ValueError("Incremental generation requires an output directory.")
+    if incremental and sink is not None and not isinstance(sink, FileSystemSink):
+        raise ValueError("Incremental generation requires a file system output sink.")
+
+
+def _get_profiling_scope(schema_name):
+    """Returns scope under which a schema's profiling stats are recorded, e.g. cim.v2.
 
-    # Invoke language specific generators.
-    for generator in _HANDLERS[language].GENERATORS:
-        func = _generate_from_template if isinstance(generator, str) else _generate_from_parser
-        func(GeneratorContext(generator, ontology, language, io_dir), generator)
+    """
+    return ".".join(schema_name.split('.')[-2:])
+
+
+def _log_batch_summary(languages, results):
+    """Logs summary table of batch generation timings.
+
+    """
+    stages = ['import', 'validate', 'ontology'] + list(languages) + ['total']
+    utils.log("BATCH SUMMARY :: elapsed time per stage (seconds)")
+    utils.log("-------------------------------------------------------------------")
+    utils.log("{0}{1}".format("schema".ljust(12), "".join(i.rjust(10) for i in stages)))
+    for label, timings in results:
+        timings = dict(timings, total=sum(i[1] for i in timings))
+        utils.log("{0}{1}".format(
+            label.ljust(12),
+            "".join(("{0:.3f}".format(timings[i]) if i in timings else "-").rjust(10) for i in stages)))
+    utils.log("-------------------------------------------------------------------")
+
+
+def generate(schema, language, io_dir, jobs=1, incremental=False, options=None, sink=None):
+    """Generates code.
+
+    :param module schema: Ontology schema definition.
+    :param str language: Target programming language.
+    :param str io_dir: Target I/O directory (may be None if a sink is passed).
+    :param int jobs: Number of generators to execute concurrently.
+    :param bool incremental: Flag indicating whether unchanged output will be skipped.
+    :param dict options: Generator options, e.g. {'slots': True}.
+    :param OutputSink sink: Destination of generated files (defaults to file system).
+
+    :returns: True if code was generated, False if schema validation failed.
+    :rtype: bool
+
+    :raises ValueError: If neither an output directory nor a sink is passed.
+
+    """
+    _validate_sink(io_dir, sink, incremental)
+    with profiling.scope(_get_profiling_scope(schema.__name__)):
+        if not _can_generate(schema, language, io_dir):
+            return False
+
+        _log_start(schema, language, io_dir, options)
+
+        # Initialise ontology.
+        ontology = create_ontology(schema)
+        utils.log("ONTOLOGY :: {0} (packages={1}, classes={2}, enums={3})".format(
+            ontology, len(ontology.packages), len(ontology.classes), len(ontology.enums)))
+
+        # Generate.
+        with _open_sink(io_dir, sink) as sink:
+            with profiling.scope(language):
+                _generate(schema, ontology, language, io_dir, jobs, incremental, options, sink)
 
     _log_end()
 
+    return True
+
+
+def generate_batch(schemas, languages, io_dir, jobs=1, incremental=False, options=None, sink=None):
+    """Generates code for a matrix of schemas & languages.
+
+    Each schema is validated and its ontology built once only, the ontology is then reused
+    across languages.  Schemas are processed concurrently when jobs > 1.
+    Worker processes cannot share a sink, when jobs > 1 each opens its own file system sink.
+
+    :param iterable schemas: Set of ontology schema definitions.
+    :param iterable languages: Set of target programming languages.
+    :param str io_dir: Target I/O directory (may be None if a sink is passed & jobs = 1).
+    :param int jobs: Number of schemas to process concurrently.
+    :param bool incremental: Flag indicating whether unchanged output will be skipped.
+    :param dict options: Generator options, e.g. {'slots': True}.
+    :param OutputSink sink: Destination of generated files (defaults to file system).
+
+    :returns: Set of (schema, timings) tuples, where timings are (stage, elapsed time) tuples.
+    :rtype: list
+
+    :raises ValueError: If neither an output directory nor a sink is passed.
+
+    """
+    for language in languages:
+        if not language in _HANDLERS:
+            err = "Programming language is unsupported [{}].  Supported languages are {}."
+            err = err.format(language, _HANDLERS.keys())
+            raise ValueError(err)
+    _validate_sink(io_dir, sink, incremental)
+    if io_dir is not None and not os.path.exists(io_dir):
+        raise IOError("Output directory does not exist [{0}].".format(io_dir))
+    if jobs > 1 and sink is not None and not isinstance(sink, FileSystemSink):
+        raise ValueError("Output sink cannot be shared across worker processes [{0}].".format(
+            type(sink).__name__))
+    if jobs > 1 and io_dir is None:
+        raise ValueError("Output directory is required when schemas are processed by worker processes.")
+
+    utils.log("Welcome to the ES-DOC meta-programming code generator !")
+    utils.log("GENERATION OPTION : ontology schemas = {0}".format(
+        ", ".join("{0} v{1}".format(s.NAME, s.VERSION) for s in schemas)))
+    utils.log("GENERATION OPTION : programming languages = {0}".format(", ".join(languages)))
+    utils.log("GENERATION OPTION : output directory = {0}".format(io_dir or "(in memory)"))
+    _log_options(options)
+
+    write_jobs = sink.workers if isinstance(sink, FileSystemSink) else 0
+    items = [(s.__name__, tuple(languages), io_dir, incremental, options, write_jobs)
+             for s in schemas]
+    if jobs > 1:
+        utils.log("GENERATION OPTION : jobs = {0}".format(jobs))
+        pool = multiprocessing.Pool(min(jobs, len(items)))
+        try:
+            results = []
+            for result, stats in pool.map(_generate_batch_item_in_worker, items):
+                profiling.merge(stats)
+                results.append(result)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        results = []
+        for item in items:
+            with profiling.scope(_get_profiling_scope(item[0])):
+                results.append(_generate_batch_item(item, sink))
+
+    _log_batch_summary(languages, results)
+    _log_end()
+
+    return results
+
+
+def generate_to_memory(schema, language, jobs=1, options=None):
+    """Generates code in memory, i.e. without touching the file system.
+
+    :param module schema: Ontology schema definition.
+    :param str language: Target programming language.
+    :param int jobs: Number of generators to execute concurrently.
+    :param dict options: Generator options, e.g. {'slots': True}.
+
+    :returns: Map of relative file path -> code, e.g. {'cim/v2/typeset.py': '...'}.
+    :rtype: dict
+
+    :raises InvalidOntologySchema: If schema validation fails (errors are logged).
+
+    """
+    sink = MemorySink()
+    if not generate(schema, language, None, jobs, False, options, sink):
+        raise InvalidOntologySchema("Invalid ontology schema [{0} v{1}].".format(schema.NAME, schema.VERSION))
+
+    return sink.files
+
+
+def write_files(files, io_dir, sink=None):
+    """Writes a set of generated files, e.g. as returned by generate_to_memory.
+
+    :param dict files: Map of relative file path -> code.
+    :param str io_dir: Target I/O directory.
+    :param OutputSink sink: Destination of generated files (defaults to file system).
+
+    """
+    if not os.path.exists(io_dir):
+        raise IOError("Output directory does not exist [{0}].".format(io_dir))
+
+    with _open_sink(io_dir, sink) as sink:
+        for fpath, code in sorted(files.items()):
+            sink.write(code, os.path.join(io_dir, os.path.dirname(fpath)), os.path.basename(fpath))
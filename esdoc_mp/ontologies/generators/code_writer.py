@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: esdoc_mp.ontologies.generators.code_writer
+   :platform: Unix, Windows
+   :synopsis: Buffered code writer & single pass placeholder substitution.
+
+.. moduleauthor:: Mark Conway-Greenslade <momipsl@ipsl.jussieu.fr>
+
+
+"""
+import re
+
+
+
+# Standard 4 character python indent.
+_INDENT = '    '
+
+# Standard line return.
+_LINE_RETURN = '\n'
+
+# Template placeholder reg-ex, e.g. {class-name}.
+_RE_PLACEHOLDER = re.compile(r'\{[a-z][a-z0-9_\-]*\}')
+
+# Template placeholder reg-ex used to split templates (N.B. capturing groups defeat sub's fast path).
+_RE_PLACEHOLDER_SPLIT = re.compile(r'(\{[a-z][a-z0-9_\-]*\})')
+
+
+class CodeWriter(object):
+    """An indentation aware code writer.
+
+    Code fragments are buffered and joined once, either in a list (default) or
+    in a file like stream such as io.StringIO.
+
+    :ivar int level: Current indentation level.
+
+    """
+    def __init__(self, stream=None, level=0):
+        """Instance constructor.
+
+        :param file stream: Optional file like object to which code is written.
+        :param int level: Initial indentation level.
+
+        """
+        self.level = level
+        self._stream = stream
+        self._buffer = [] if stream is None else None
+        self._write = self._buffer.append if stream is None else stream.write
+
+
+    def __str__(self):
+        """Returns code written so far.
+
+        """
+        return self.getvalue()
+
+
+    def write(self, code):
+        """Writes a code fragment.
+
+        :param str code: Code to be written.
+
+        """
+        self._write(code)
+
+        return self
+
+
+    def write_line(self, code="", indent=None):
+        """Writes an indented line of code followed by a line return.
+
+        :param str code: Code to be written.
+        :param int indent: Indentation level (defaults to current level).
+
+        """
+        self._write(_INDENT * (self.level if indent is None else indent))
+        self._write(code)
+        self._write(_LINE_RETURN)
+
+        return self
+
+
+    def write_indent(self, count=1):
+        """Writes a code indentation.
+
+        :param int count: Number of indentations to write.
+
+        """
+        self._write(_INDENT * count)
+
+        return self
+
+
+    def write_line_return(self, count=1):
+        """Writes a code line return.
+
+        :param int count: Number of line returns to write.
+
+        """
+        self._write(_LINE_RETURN * count)
+
+        return self
+
+
+    def write_template(self, template, params):
+        """Writes a code template substituting its placeholders.
+
+        :param CodeTemplate template: Template to be written.
+        :param dict params: Placeholder values keyed by placeholder name.
+
+        """
+        template.write(self, params)
+
+        return self
+
+
+    def indent(self, count=1):
+        """Increments indentation level.
+
+        :param int count: Number of indentation levels.
+
+        """
+        self.level += count
+
+        return self
+
+
+    def dedent(self, count=1):
+        """Decrements indentation level.
+
+        :param int count: Number of indentation levels.
+
+        """
+        self.level = max(0, self.level - count)
+
+        return self
+
+
+    def getvalue(self):
+        """Returns code written so far.
+
+        """
+        if self._buffer is None:
+            return self._stream.getvalue()
+
+        # Collapse buffer so as to avoid re-joining upon subsequent calls.
+        code = "".join(self._buffer)
+        self._buffer[:] = [code]
+
+        return code
+
+
+class CodeTemplate(object):
+    """A code template whose {placeholder} tokens are substituted in a single pass.
+
+    The template text is split into literal & placeholder segments once upon
+    instantiation.  Placeholders without a value are emitted verbatim so that
+    they may be substituted later (e.g. by generator_utils.format_code).
+
+    """
+    def __init__(self, text):
+        """Instance constructor.
+
+        :param str text: Template text.
+
+        """
+        self.text = text
+
+        # Split into head literal plus (placeholder name, placeholder token, trailing literal) segments.
+        parts = _RE_PLACEHOLDER_SPLIT.split(text)
+        self._head = parts[0]
+        self._segments = tuple((token[1:-1], token, literal)
+                               for token, literal in zip(parts[1::2], parts[2::2]))
+
+
+    def write(self, writer, params):
+        """Writes template to a code writer substituting its placeholders.
+
+        :param CodeWriter writer: Code writer.
+        :param dict params: Placeholder values keyed by placeholder name.
+
+        """
+        writer.write(self.substitute(params))
+
+
+    def substitute(self, params):
+        """Returns template text with its placeholders substituted.
+
+        :param dict params: Placeholder values keyed by placeholder name.
+
+        """
+        code = [self._head]
+        for name, token, literal in self._segments:
+            code.append(params.get(name, token))
+            code.append(literal)
+
+        return "".join(code)
+
+
+def substitute(text, params):
+    """Returns text with its {placeholder} tokens substituted in a single pass.
+
+    :param str text: Text containing placeholders.
+    :param dict params: Placeholder values keyed by placeholder name.
+
+    """
+    def _get_value(match):
+        return params.get(match.group(0)[1:-1], match.group(0))
+
+    return _RE_PLACEHOLDER.sub(_get_value, text)
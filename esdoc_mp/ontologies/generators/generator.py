@@ -11,6 +11,7 @@
 """
 from abc import ABCMeta
 
+from esdoc_mp import profiling
 from esdoc_mp.ontologies.generators import generator_utils as gu
 
 
@@ -33,22 +34,28 @@ class Generator(object):
             return
 
         # Notify start.
-        self.on_start(ctx)
+        with profiling.timer('generator.{0}.on_start'.format(ctx.key)):
+            self.on_start(ctx)
 
         # Raise parsing events and emit code accordingly.
-        self.on_ontology_parse(ctx)
-        for pkg in ctx.ontology.packages:
-            ctx.set_package(pkg)
-            self.on_package_parse(ctx)
-        for cls in ctx.ontology.classes:
-            ctx.set_class(cls)
-            self.on_class_parse(ctx)
-        for enum in ctx.ontology.enums:
-            ctx.set_enum(enum)
-            self.on_enum_parse(ctx)
+        with profiling.timer('generator.{0}.on_ontology_parse'.format(ctx.key)):
+            self.on_ontology_parse(ctx)
+        with profiling.timer('generator.{0}.on_package_parse'.format(ctx.key)):
+            for pkg in ctx.ontology.packages:
+                ctx.set_package(pkg)
+                self.on_package_parse(ctx)
+        with profiling.timer('generator.{0}.on_class_parse'.format(ctx.key)):
+            for cls in ctx.ontology.classes:
+                ctx.set_class(cls)
+                self.on_class_parse(ctx)
+        with profiling.timer('generator.{0}.on_enum_parse'.format(ctx.key)):
+            for enum in ctx.ontology.enums:
+                ctx.set_enum(enum)
+                self.on_enum_parse(ctx)
 
         # Notify end.
-        self.on_end(ctx)
+        with profiling.timer('generator.{0}.on_end'.format(ctx.key)):
+            self.on_end(ctx)
 
 
     def _write_code(self, ctx, code):
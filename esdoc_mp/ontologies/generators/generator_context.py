@@ -9,17 +9,8 @@
 
 
 """
-import os
+from esdoc_mp.ontologies.generators import generator_utils as gu
 
-import tornado
-
-
-
-# Cache of tornado template loaders.
-_TEMPLATE_LOADERS = {}
-
-# Cache of loaded tornado templates.
-_TEMPLATE_CACHE = {}
 
 
 class GeneratorContext(object):
@@ -29,13 +20,15 @@ class GeneratorContext(object):
     :ivar ontology: Ontology being processed.
     :ivar language: Language of generation, e.g. python.
     :ivar io_dir: Directory to which output will be written.
+    :ivar options: Generator options, e.g. {'slots': True}.
 
     """
-    def __init__(self, generator, ontology, language, io_dir):
+    def __init__(self, generator, ontology, language, io_dir, options=None):
         """Instance constructor.
 
         """
         self.generator = generator
+        self.options = options or {}
         self.language = language
         self.output_dir = io_dir
         self.key = generator if isinstance(generator, str) else generator.__name__
@@ -96,14 +89,8 @@ class GeneratorContext(object):
         :module lu: Lanaugage specific utility functions passed to template.
 
         """
-        # Set the template loader.
-        template_dir = "{}/{}/templates".format(os.path.dirname(__file__), self.language)
-        if template_dir not in _TEMPLATE_LOADERS:
-            _TEMPLATE_LOADERS[template_dir] = tornado.template.Loader(template_dir)
-        template_loader = _TEMPLATE_LOADERS[template_dir]
-
-        # Load template & return generated code.
-        template = template_loader.load(template)
+        # Load template (via shared language loader) & return generated code.
+        template = gu.load_tornado_template(self.language, template)
 
         return template.generate(
             o=self.ontology,
@@ -14,6 +14,11 @@ import os
 import pwd
 
 import tornado
+import tornado.template
+
+from esdoc_mp import profiling
+from esdoc_mp.ontologies.generators.code_writer import CodeTemplate
+from esdoc_mp.ontologies.generators.code_writer import substitute
 
 
 
@@ -29,8 +34,8 @@ _LINE_RETURN = '\n'
 # Set of loaded templates.
 _loaded_templates = dict()
 
-# Set of loaded tornado templates.
-_loaded_tornado_templates = dict()
+# Set of tornado template loaders, one per language.
+_tornado_loaders = dict()
 
 
 def convert_to_camel_case(name, separator='_'):
@@ -114,6 +119,16 @@ def load_templates(language, filenames):
     return templates
 
 
+def load_code_templates(language, filenames):
+    """Returns a dictionary of loaded code templates prepared for single pass substitution.
+
+    :param str language: Generator language.
+    :param str filenames: Set of template file names.
+
+    """
+    return {k: CodeTemplate(v) for k, v in load_templates(language, filenames).items()}
+
+
 def load_tornado_template(language, fname):
     """Returns tornado code template.
 
@@ -121,14 +136,10 @@ def load_tornado_template(language, fname):
     :param str fname: Name of template file.
 
     """
-    dir_ = _TEMPLATE_FOLDER + "/{0}/templates".format(language)
-
-    fpath = os.path.join(dir_, fname)
-    if fpath not in _loaded_tornado_templates:
-        loader = tornado.template.Loader(dir_)
-        _loaded_tornado_templates[fpath] = loader.load(fpath)
+    if language not in _tornado_loaders:
+        _tornado_loaders[language] = tornado.template.Loader(_TEMPLATE_FOLDER + "/{0}/templates".format(language))
 
-    return _loaded_tornado_templates[fpath]
+    return _tornado_loaders[language].load(fname)
 
 
 def load_tornado_templates(language, fnames):
@@ -141,6 +152,22 @@ def load_tornado_templates(language, fnames):
     return {fname: load_tornado_template(language, fname) for fname in fnames}
 
 
+def preload_templates(language):
+    """Loads all of a language's code templates in a single pass.
+
+    :param str language: Generator language.
+
+    """
+    dir_ = _TEMPLATE_FOLDER + "/{0}/templates".format(language)
+    if not os.path.isdir(dir_):
+        return
+    for fname in sorted(os.listdir(dir_)):
+        if fname.endswith('.tornado'):
+            load_tornado_template(language, fname)
+        elif fname.endswith('.txt'):
+            _load_template(language, fname)
+
+
 def get_username():
     """Returns name of current user.
 
@@ -157,7 +184,7 @@ def emit_indent(count=1):
     :param int count: Number of indentations to emit.
 
     """
-    return reduce(lambda x, y: x + _INDENT, range(count), '')
+    return _INDENT * count
 
 
 def emit_tab():
@@ -173,7 +200,7 @@ def emit_line_return(count=1):
     :param int count: Number of line returns to emit.
 
     """
-    return reduce(lambda x, y: x + _LINE_RETURN, range(count), '')
+    return _LINE_RETURN * count
 
 
 def create_directory(dir):
@@ -188,6 +215,7 @@ def create_directory(dir):
         pass
 
 
+@profiling.timed('write_file')
 def write_file(code, dir, file):
     """Writes code to a file.
 
@@ -200,14 +228,28 @@ def write_file(code, dir, file):
     create_directory(dir)
 
     # Update code.
-    code = code.replace('{file-name}', file)
+    code = format_file_code(code, file)
 
     # Write file.
     file = open(dir + "/" + file, 'w')
-    file.writelines(code)
+    file.write(code)
     file.close()
 
+    profiling.increment('files.written')
+    profiling.increment('bytes.written', len(code))
 
+
+def format_file_code(code, file):
+    """Formats code with file specific params prior to being written to file system.
+
+    :param str code: Code to be injected with file specific params.
+    :param str file: Name of code file being written.
+
+    """
+    return code.replace('{file-name}', file)
+
+
+@profiling.timed('format_code')
 def format_code(ctx, code):
     """Formats code prior to being written to file system.
 
@@ -215,13 +257,13 @@ def format_code(ctx, code):
     :param str code: Code to be injected with standard params.
 
     """
-    # Ontology related params.
-    code = code.replace('{ontology-name}', ctx.ontology.op_name)
-    code = code.replace('{ontology-version}', ctx.ontology.op_version)
-    code = code.replace('{ontology-version-packagename}', ctx.ontology.op_version.replace('.', '_'))
-
-    # Misceallaneous params.
-    code = code.replace('{datetime-year}', str(datetime.datetime.now().year))
-    code = code.replace('{user-name}', get_username())
-
-    return code
+    return substitute(code, {
+        # Ontology related params.
+        'ontology-name': ctx.ontology.op_name,
+        'ontology-version': ctx.ontology.op_version,
+        'ontology-version-packagename': ctx.ontology.op_version.replace('.', '_'),
+
+        # Misceallaneous params.
+        'datetime-year': str(datetime.datetime.now().year),
+        'user-name': get_username()
+        })
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: esdoc_mp.ontologies.generators.manifest
+   :platform: Unix, Windows
+   :synopsis: Manifest of generated code used to support incremental generation.
+
+.. moduleauthor:: Mark Conway-Greenslade <momipsl@ipsl.jussieu.fr>
+
+
+"""
+import json
+import os
+
+import esdoc_mp
+from esdoc_mp.ontologies.generators.output_sink import write_atomic
+from esdoc_mp.utils import get_directory_hash
+from esdoc_mp.utils import get_hash
+
+
+
+# Manifest file name template.
+_FILE_NAME = ".esdoc_mp_manifest.{0}.v{1}.{2}.json"
+
+# Directory of language independent generator code, e.g. generator.py, generator_utils.py.
+_GENERATORS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Directory of ontology model code, i.e. ontology construction & validation.
+_CORE_DIR = os.path.join(os.path.dirname(_GENERATORS_DIR), 'core')
+
+
+class Manifest(object):
+    """Records the inputs to & outputs from a generation run, i.e. schema & template hashes plus emitted files.
+
+    Inputs also include the shared generator & ontology code, i.e. editing either invalidates previous runs.
+
+    """
+    def __init__(self, schema, language, io_dir, templates_dir, options=None):
+        """Instance constructor.
+
+        :param module schema: Ontology schema definition.
+        :param str language: Target programming language.
+        :param str io_dir: Target I/O directory.
+        :param str templates_dir: Directory containing language specific generators & templates.
+        :param dict options: Generator options, e.g. {'slots': True}.
+
+        """
+        self.io_dir = io_dir
+        self.fpath = os.path.join(io_dir, _FILE_NAME.format(schema.NAME, schema.VERSION, language))
+        self.inputs = "{0}|{1}|{2}|{3}|{4}".format(
+            esdoc_mp.__version__,
+            get_directory_hash(os.path.dirname(schema.__file__), ('.py', )),
+            get_directory_hash(templates_dir, ('.py', '.txt', '.tornado')),
+            get_directory_hash(_GENERATORS_DIR, ('.py', ), recursive=False),
+            get_directory_hash(_CORE_DIR, ('.py', ))
+            )
+        options = {k: v for k, v in (options or {}).items() if v}
+        if options:
+            self.inputs += "|" + json.dumps(options, sort_keys=True)
+        self.inputs = get_hash(self.inputs)
+        self.is_inputs_unchanged = False
+        self.previous = {}
+        self.outputs = {}
+        self.written = 0
+        self.skipped = 0
+        self.deleted = 0
+
+        if os.path.exists(self.fpath):
+            with open(self.fpath, 'r') as f:
+                manifest = json.loads(f.read())
+            self.is_inputs_unchanged = manifest.get('inputs') == self.inputs
+            self.previous = manifest.get('outputs', {})
+
+
+    def is_unchanged(self, key):
+        """Returns flag indicating whether a generator's inputs & outputs are unchanged since previous run.
+
+        :param str key: Generator key.
+
+        """
+        files = self.previous.get(key)
+        if not self.is_inputs_unchanged or not files:
+            return False
+
+        return all(self._is_file_unchanged(fpath, code_hash) for fpath, code_hash in files.items())
+
+
+    def skip(self, key):
+        """Records that a generator has been skipped, i.e. its previous outputs are retained.
+
+        :param str key: Generator key.
+
+        """
+        self.outputs[key] = self.previous[key]
+        self.skipped += len(self.outputs[key])
+
+
+    def is_written(self, key, fpath, code):
+        """Records a generated file returning a flag indicating whether it needs to be written.
+
+        :param str key: Generator key.
+        :param str fpath: Path to generated file.
+        :param str code: Generated code.
+
+        """
+        fpath = os.path.relpath(fpath, self.io_dir)
+        code_hash = get_hash(code)
+        self.outputs.setdefault(key, {})[fpath] = code_hash
+
+        if self.previous.get(key, {}).get(fpath) == code_hash and \
+           self._is_file_unchanged(fpath, code_hash):
+            self.skipped += 1
+            return False
+
+        self.written += 1
+        return True
+
+
+    def save(self):
+        """Deletes files that are no longer generated & persists manifest.
+
+        """
+        current = {fpath for files in self.outputs.values() for fpath in files}
+        for fpath in {fpath for files in self.previous.values() for fpath in files} - current:
+            if os.path.exists(os.path.join(self.io_dir, fpath)):
+                os.remove(os.path.join(self.io_dir, fpath))
+                self.deleted += 1
+
+        write_atomic(json.dumps({
+            'inputs': self.inputs,
+            'outputs': self.outputs
+            }, indent=4, sort_keys=True), self.fpath)
+
+
+    def _is_file_unchanged(self, fpath, code_hash):
+        """Returns flag indicating whether a previously generated file is on disk & unmodified.
+
+        :param str fpath: Path to generated file relative to I/O directory.
+        :param str code_hash: Hash of generated code.
+
+        """
+        fpath = os.path.join(self.io_dir, fpath)
+        if not os.path.exists(fpath):
+            return False
+        with open(fpath, 'r') as f:
+            return get_hash(f.read()) == code_hash
@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: esdoc_mp.ontologies.generators.output_sink
+   :platform: Unix, Windows
+   :synopsis: Destinations to which generated code files are written, e.g. file system, memory, zip archive.
+
+.. moduleauthor:: Mark Conway-Greenslade <momipsl@ipsl.jussieu.fr>
+
+
+"""
+import errno
+import itertools
+import os
+import Queue
+import threading
+import zipfile
+
+from esdoc_mp import profiling
+from esdoc_mp.ontologies.generators.generator_utils import format_file_code
+
+
+
+# Sequence of temporary file name suffixes, i.e. unique within a process.
+_TMP_FILE_IDS = itertools.count()
+
+
+class OutputSink(object):
+    """Base class of destinations to which generated code files are written.
+
+    :ivar str root: Directory relative to which file paths are reported.
+
+    """
+    def __init__(self, root=None):
+        """Instance constructor.
+
+        :param str root: Directory relative to which file paths are reported.
+
+        """
+        self.root = root
+
+
+    def __enter__(self):
+        """Context manager entry point.
+
+        """
+        return self
+
+
+    def __exit__(self, *args):
+        """Context manager exit point.
+
+        """
+        self.close()
+
+
+    def get_path(self, dir_, fname):
+        """Returns path of a generated file, relative to the sink root if set.
+
+        :param str dir_: Directory into which code is generated.
+        :param str fname: Name of code file.
+
+        """
+        fpath = os.path.join(dir_, fname)
+
+        return fpath if self.root is None else os.path.relpath(fpath, self.root)
+
+
+    def write(self, code, dir_, fname):
+        """Writes code to a file.
+
+        :param str code: Code to be written to a file.
+        :param str dir_: Directory into which code is generated.
+        :param str fname: Name of code file being written.
+
+        """
+        code = format_file_code(code, fname)
+        with profiling.timer('write_file'):
+            self._write(code, dir_, fname)
+
+        profiling.increment('files.written')
+        profiling.increment('bytes.written', len(code))
+
+
+    def _write(self, code, dir_, fname):
+        """Writes formatted code to a file.
+
+        """
+        raise NotImplementedError()
+
+
+    def flush(self):
+        """Waits until pending writes have completed.
+
+        """
+        pass
+
+
+    def close(self):
+        """Flushes pending writes & releases resources.
+
+        """
+        self.flush()
+
+
+class FileSystemSink(OutputSink):
+    """Writes files to the file system, each file being written atomically via a temporary file.
+
+    Directories are created once only.  When workers > 0 files are written by a
+    pool of background threads, errors are raised upon flush.
+
+    :ivar int workers: Number of writer threads (0 = synchronous).
+
+    """
+    def __init__(self, root=None, workers=0):
+        """Instance constructor.
+
+        :param str root: Directory relative to which file paths are reported.
+        :param int workers: Number of writer threads (0 = synchronous).
+
+        """
+        super(FileSystemSink, self).__init__(root)
+        self.workers = workers
+        self._directories = set()
+        self._errors = []
+        self._queue = None
+        self._threads = []
+        if workers > 0:
+            self._queue = Queue.Queue()
+            for _ in range(workers):
+                thread = threading.Thread(target=self._write_queued)
+                thread.daemon = True
+                thread.start()
+                self._threads.append(thread)
+
+
+    def _write(self, code, dir_, fname):
+        """Writes formatted code to a file.
+
+        """
+        if dir_ not in self._directories:
+            _create_directory(dir_)
+            self._directories.add(dir_)
+
+        if self._queue is None:
+            write_atomic(code, os.path.join(dir_, fname))
+        else:
+            self._queue.put((code, os.path.join(dir_, fname)))
+
+
+    def _write_queued(self):
+        """Writer thread loop - writes queued files until a stop sentinel is dequeued.
+
+        """
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                write_atomic(*item)
+            except Exception as err:
+                self._errors.append(err)
+            finally:
+                self._queue.task_done()
+
+
+    def flush(self):
+        """Waits until pending writes have completed, raising the first write error (if any).
+
+        """
+        if self._queue is not None:
+            with profiling.timer('write_flush'):
+                self._queue.join()
+        if self._errors:
+            errors, self._errors = self._errors, []
+            raise errors[0]
+
+
+    def close(self):
+        """Flushes pending writes & stops writer threads.
+
+        """
+        try:
+            self.flush()
+        finally:
+            for _ in self._threads:
+                self._queue.put(None)
+            for thread in self._threads:
+                thread.join()
+            self._threads = []
+            self._queue = None
+
+
+class MemorySink(OutputSink):
+    """Retains files in memory.
+
+    :ivar dict files: Map of file path -> code.
+
+    """
+    def __init__(self, root=None):
+        """Instance constructor.
+
+        :param str root: Directory relative to which file paths are reported.
+
+        """
+        super(MemorySink, self).__init__(root)
+        self.files = {}
+
+
+    def _write(self, code, dir_, fname):
+        """Writes formatted code to a file.
+
+        """
+        self.files[self.get_path(dir_, fname)] = code
+
+
+class ZipSink(OutputSink):
+    """Writes files to a zip archive.
+
+    :ivar str fpath: Path to zip archive.
+
+    """
+    def __init__(self, fpath, root=None, compression=zipfile.ZIP_DEFLATED):
+        """Instance constructor.
+
+        :param str fpath: Path to zip archive.
+        :param str root: Directory relative to which archived file paths are set.
+        :param int compression: Zip compression method.
+
+        """
+        super(ZipSink, self).__init__(root)
+        self.fpath = fpath
+        self._archive = zipfile.ZipFile(fpath, 'w', compression)
+
+
+    def _write(self, code, dir_, fname):
+        """Writes formatted code to a file.
+
+        """
+        self._archive.writestr(self.get_path(dir_, fname), code)
+
+
+    def close(self):
+        """Finalises archive.
+
+        """
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
+
+
+def _create_directory(dir_):
+    """Creates a directory (plus parents) unless it already exists.
+
+    """
+    try:
+        os.makedirs(dir_)
+    except OSError as err:
+        if err.errno != errno.EEXIST or not os.path.isdir(dir_):
+            raise
+
+
+def _open_temporary_file(fpath):
+    """Opens a new temporary file alongside a target file, permissions are subject to the process umask.
+
+    """
+    while True:
+        tmp_fpath = os.path.join(os.path.dirname(fpath), ".{0}.{1}.{2}.tmp".format(
+            os.path.basename(fpath), os.getpid(), next(_TMP_FILE_IDS)))
+        try:
+            return os.open(tmp_fpath, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0666), tmp_fpath
+        except OSError as err:
+            if err.errno != errno.EEXIST:
+                raise
+
+
+def write_atomic(code, fpath):
+    """Writes code to a temporary file which then replaces the target file.
+
+    :param str code: Code to be written.
+    :param str fpath: Path to target file.
+
+    """
+    fd, tmp_fpath = _open_temporary_file(fpath)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(code)
+        if os.name == 'nt' and os.path.exists(fpath):
+            os.remove(fpath)
+        os.rename(tmp_fpath, fpath)
+    except:
+        if os.path.exists(tmp_fpath):
+            os.remove(tmp_fpath)
+        raise
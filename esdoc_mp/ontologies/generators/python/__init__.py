@@ -1,5 +1,6 @@
 from esdoc_mp.ontologies.generators.python import utils
 from esdoc_mp.ontologies.generators.python.decoder_generator import DecoderGenerator
+from esdoc_mp.ontologies.generators.python.lazy_import_generator import LazyImportGenerator
 from esdoc_mp.ontologies.generators.python.package_extended_schema_generator import PackageExtendedSchemaGenerator
 from esdoc_mp.ontologies.generators.python.package_typeset_generator import PackageTypeSetGenerator
 
@@ -15,5 +16,6 @@ GENERATORS = {
     'typeset.tornado',
     PackageExtendedSchemaGenerator,
     PackageTypeSetGenerator,
-    DecoderGenerator
+    DecoderGenerator,
+    LazyImportGenerator
 }
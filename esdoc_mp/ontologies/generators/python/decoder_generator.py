@@ -9,9 +9,8 @@
 
 
 """
-from operator import add
-
 from esdoc_mp.ontologies.generators import generator_utils as gu
+from esdoc_mp.ontologies.generators.code_writer import CodeWriter
 from esdoc_mp.ontologies.generators.generator import Generator
 from esdoc_mp.ontologies.generators.python import utils as pgu
 
@@ -33,7 +32,7 @@ _TEMPLATE_DECODER_FUNCTION = "decoder_function.txt"
 _TEMPLATE_DECODER_XML_UTILS = "decoder_xml_utils.txt"
 
 # Loaded templates.
-_TEMPLATES = gu.load_templates(_LANG, (
+_TEMPLATES = gu.load_code_templates(_LANG, (
     _TEMPLATE_MAIN,
     _TEMPLATE_DECODER_MODULE,
     _TEMPLATE_DECODER_FUNCTION,
@@ -70,7 +69,7 @@ class DecoderGenerator(Generator):
         )
         ctx.code.append(
             (
-                _TEMPLATES[_TEMPLATE_DECODER_XML_UTILS],
+                _TEMPLATES[_TEMPLATE_DECODER_XML_UTILS].text,
                 pgu.get_ontology_directory(ctx),
                 pgu.get_module_file_name('decoder_xml_utils')
             )
@@ -94,47 +93,39 @@ class DecoderGenerator(Generator):
 
 def _emit_module_decoder_for_pkg(o, p):
     """Emits package decoder module."""
-    code = _TEMPLATES[_TEMPLATE_DECODER_MODULE]
-    code = code.replace('{module-imports}', _emit_snippet_decoder_imports(o, p))
-    code = code.replace('{decoding-functions}', _emit_snippet_decoding_fns(p))
+    w = CodeWriter()
+    _write_snippet_decoding_fns(w, p)
 
-    return code
+    return _TEMPLATES[_TEMPLATE_DECODER_MODULE].substitute({
+        'module-imports': _emit_snippet_decoder_imports(o, p),
+        'decoding-functions': w.getvalue()
+        })
 
 
 def _emit_snippet_decoder_imports(o, p):
     """Emits set of package decoder imports."""
-    imports = []
-
-    def append_import(imp):
-        if imp not in imports:
-            imports.append(imp)
-
     # Set type decoding imports.
-    for type_ in [t for t in p.external_types if t.is_class]:
-        imp = 'from {0} import *'.format(
-            pgu.get_package_module_name(type_.name_of_package, 'decoder'))
-        append_import(imp)
+    imports = {'from {0} import *'.format(pgu.get_package_module_name(t.name_of_package, 'decoder'))
+               for t in p.external_types if t.is_class}
 
-    if len(imports) > 0:
-        return reduce(add, map(lambda i : i + gu.emit_line_return(), sorted(imports)))
-    else:
-        return ''
+    w = CodeWriter()
+    for imp in sorted(imports):
+        w.write_line(imp)
 
+    return w.getvalue()
 
-def _emit_snippet_decoding_fns(p):
-    """Emits set of package class decodings."""
-    code = ''
-    for c in sorted(p.classes, key=lambda c: c.op_func_name):
-        fn = _TEMPLATES[_TEMPLATE_DECODER_FUNCTION]
-        fn = fn.replace('{class-name}', c.op_name)
-        fn = fn.replace('{class-function-name}', c.op_func_name)
-        fn = fn.replace('{package-name}', c.package.op_name)
-        fn = fn.replace('{class-doc-name}', c.op_doc_string_name)
-        fn = fn.replace('{class-decodings}', _emit_snippet_decodings(c))
-        fn += gu.emit_line_return(3)
-        code += fn
 
-    return code
+def _write_snippet_decoding_fns(w, p):
+    """Writes set of package class decodings."""
+    for c in sorted(p.classes, key=lambda c: c.op_func_name):
+        w.write_template(_TEMPLATES[_TEMPLATE_DECODER_FUNCTION], {
+            'class-name': c.op_name,
+            'class-function-name': c.op_func_name,
+            'package-name': c.package.op_name,
+            'class-doc-name': c.op_doc_string_name,
+            'class-decodings': _emit_snippet_decodings(c)
+            })
+        w.write_line_return(3)
 
 
 def _emit_snippet_decodings(c):
@@ -145,7 +136,11 @@ def _emit_snippet_decodings(c):
             if dc.decoding is not None:
                 code.append(_emit_snippet_decoding(p, dc.decoding, dc.type))
 
-    return gu.emit(code)
+    w = CodeWriter()
+    for decoding in sorted(code):
+        w.write_line_return().write_indent().write(decoding)
+
+    return w.getvalue()
 
 
 def _get_decoding_function(prp, type_):
@@ -157,14 +152,13 @@ def _get_decoding_function(prp, type_):
     # ... complex classes - return class functional name.
     elif prp.type.is_class:
         type_name = prp.type.name if type_ is None else type_
-        return _get_decoder_function_name(type_name)
+        return pgu.get_decoder_function_name(type_name)
 
 
 def _emit_snippet_decoding(prp, decoding, type_):
     """Emits a class property decoding."""
-    tmpl = '{0}(\'{1}\', {2}, {3}, \'{4}\'),'
+    tmpl = '(\'{0}\', {1}, {2}, \'{3}\'),'
     return tmpl.format(
-        gu.emit_line_return() + gu.emit_indent(2),
         prp.name,
         prp.is_collection,
         _get_decoding_function(prp, type_),
@@ -173,22 +167,17 @@ def _emit_snippet_decoding(prp, decoding, type_):
 
 def _emit_module_init(o):
     """Emits package initializer."""
-    def get_imports():
-        def get_code(c):
-            return "from {0} import {1}".format(
-                pgu.get_package_module_name(c.package, 'decoder'),
-                _get_decoder_function_name(c)) + gu.emit_line_return()
-
-        return gu.emit(o.entities, get_code)
-
-    code = _TEMPLATES[_TEMPLATE_MAIN]
-    code = code.replace('{module-imports}', get_imports())
-
-    return code
-
-
-def _get_decoder_function_name(name):
-    """Converts class name to a decoder function name.
-
-    """
-    return 'decode_{0}'.format(pgu.get_type_func_name(name))
+    w = CodeWriter()
+    for imp in sorted("from {0} import {1}".format(pgu.get_package_module_name(c.package, 'decoder'),
+                                                   pgu.get_decoder_function_name(c))
+                      for c in o.entities):
+        w.write_line(imp)
+
+    document_decoders = CodeWriter()
+    for c, tag in sorted(pgu.get_document_tags(o).items(), key=lambda i: i[1]):
+        document_decoders.write_line("'{0}': {1},".format(tag, pgu.get_decoder_function_name(c)), indent=1)
+
+    return _TEMPLATES[_TEMPLATE_MAIN].substitute({
+        'module-imports': w.getvalue(),
+        'document-decoders': document_decoders.getvalue()
+        })
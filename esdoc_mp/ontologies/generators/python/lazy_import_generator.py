@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: esdoc_mp.ontologies.generators.python.lazy_import_generator.py
+   :platform: Unix, Windows
+   :synopsis: Generates lazy import proxies for an ontology's package initialiser, typeset & type information.
+
+.. moduleauthor:: Mark Conway-Greenslade <momipsl@ipsl.jussieu.fr>
+
+
+"""
+from esdoc_mp.ontologies.generators import generator_utils as gu
+from esdoc_mp.ontologies.generators.code_writer import CodeWriter
+from esdoc_mp.ontologies.generators.generator import Generator
+from esdoc_mp.ontologies.generators.python import utils as pgu
+
+
+
+# Generator language.
+_LANG = 'python'
+
+# Template for lazy import utilities.
+_TEMPLATE_LAZY_IMPORT = "lazy_import.txt"
+
+# Template for a lazy package initialiser.
+_TEMPLATE_LAZY_INIT = "lazy_init.txt"
+
+# Template for a lazy typeset module.
+_TEMPLATE_LAZY_TYPESET = "lazy_typeset.txt"
+
+# Template for a lazy type information module.
+_TEMPLATE_LAZY_TYPE_INFO = "lazy_type_info.txt"
+
+# Loaded templates.
+_TEMPLATES = gu.load_code_templates(_LANG, (
+    _TEMPLATE_LAZY_IMPORT,
+    _TEMPLATE_LAZY_INIT,
+    _TEMPLATE_LAZY_TYPESET,
+    _TEMPLATE_LAZY_TYPE_INFO
+))
+
+
+class LazyImportGenerator(Generator):
+    """Generates a package whose modules & type information tables are imported upon first access.
+
+    Supersedes the __init__, typeset & type_info templates when the lazy option is set,
+    the eagerly built type information tables are emitted as type_info_tables.
+
+    """
+    def is_required(self, ctx):
+        """Predicate determing whether code generation is required.
+
+        :param GeneratorContext ctx: Generation context information.
+
+        """
+        return bool(ctx.options.get('lazy'))
+
+
+    def on_ontology_parse(self, ctx):
+        """Event handler for the ontology parse event.
+
+        :param GeneratorContext ctx: Generation context information.
+
+        """
+        for code, name in (
+            (_TEMPLATES[_TEMPLATE_LAZY_IMPORT].text, 'lazy_import'),
+            (_emit_module_init(ctx.ontology), '__init__'),
+            (_emit_module_typeset(ctx.ontology), 'typeset'),
+            (_emit_module_type_info(), 'type_info'),
+            (ctx.get_code('type_info.tornado', pgu), 'type_info_tables')
+            ):
+            ctx.code.append((code, pgu.get_ontology_directory(ctx), pgu.get_module_file_name(name)))
+
+
+def _get_typeset_loaders(o):
+    """Returns map of typeset attribute names to loader code."""
+    loaders = {}
+    for p in o.packages:
+        module = pgu.get_package_module_name(p, 'typeset')
+        loaders[p.op_name] = "lazy_import.submodule('{0}')".format(module)
+        for t in p.classes + p.enums:
+            loaders[t.op_name] = "lazy_import.attribute('{0}', '{1}')".format(module, t.op_name)
+
+    return loaders
+
+
+def _write_loaders(w, loaders):
+    """Writes a set of attribute loaders as dictionary items."""
+    for name, loader in sorted(loaders.items()):
+        w.write_line_return().write_indent().write("'{0}': {1},".format(name, loader))
+
+
+def _emit_module_init(o):
+    """Emits lazy package initialiser, i.e. typeset names are delegated to the typeset module."""
+    loaders = {name: "lazy_import.attribute('typeset', '{0}')".format(name) for name in _get_typeset_loaders(o)}
+    loaders['type_info'] = "lazy_import.submodule('type_info')"
+    loaders['typeset'] = "lazy_import.submodule('typeset')"
+    if o.decodings:
+        loaders['decoder'] = "lazy_import.submodule('decoder')"
+
+    w = CodeWriter()
+    _write_loaders(w, loaders)
+
+    return _TEMPLATES[_TEMPLATE_LAZY_INIT].substitute({
+        'loaders': w.getvalue()
+        })
+
+
+def _emit_module_typeset(o):
+    """Emits lazy typeset module."""
+    loaders = _get_typeset_loaders(o)
+
+    exports = CodeWriter()
+    for name in sorted(loaders):
+        exports.write_line_return().write_indent().write("'{0}',".format(name))
+
+    w = CodeWriter()
+    _write_loaders(w, loaders)
+
+    return _TEMPLATES[_TEMPLATE_LAZY_TYPESET].substitute({
+        'exports': exports.getvalue(),
+        'loaders': w.getvalue()
+        })
+
+
+def _emit_module_type_info():
+    """Emits lazy type information module, i.e. tables are delegated to the type_info_tables module."""
+    return _TEMPLATES[_TEMPLATE_LAZY_TYPE_INFO].substitute({
+        'exports': pgu.get_type_info_names(pgu.TYPE_INFO_EXPORTS),
+        'tables': pgu.get_type_info_names(sorted(pgu.TYPE_INFO_TABLES))
+        })
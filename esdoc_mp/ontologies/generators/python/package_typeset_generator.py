@@ -11,6 +11,7 @@
 """
 from esdoc_mp.ontologies import core
 from esdoc_mp.ontologies.generators import generator_utils as gu
+from esdoc_mp.ontologies.generators.code_writer import CodeWriter
 from esdoc_mp.ontologies.generators.python import utils as pgu
 from esdoc_mp.ontologies.generators.generator import Generator
 from esdoc_mp import utils
@@ -29,6 +30,12 @@ _TEMPLATE_CLASS_CONCRETE = "typeset_class_concrete.txt"
 # Template for an abstract class.
 _TEMPLATE_CLASS_ABSTRACT = "typeset_class_abstract.txt"
 
+# Template for a concrete class with __slots__.
+_TEMPLATE_CLASS_CONCRETE_SLOTS = "typeset_class_concrete_slots.txt"
+
+# Template for an abstract class with __slots__.
+_TEMPLATE_CLASS_ABSTRACT_SLOTS = "typeset_class_abstract_slots.txt"
+
 # Template for a class print string.
 _TEMPLATE_CLASS_PSTR = "typeset_class_pstr.txt"
 
@@ -39,10 +46,12 @@ _TEMPLATE_ENUM = "typeset_enum.txt"
 _TEMPLATE_CLASS_COMPUTED_PROPERTY = "typeset_class_computed_property.txt"
 
 # Loaded templates.
-_TEMPLATES = gu.load_templates(_LANG, (
+_TEMPLATES = gu.load_code_templates(_LANG, (
     _TEMPLATE_TYPESET,
     _TEMPLATE_CLASS_CONCRETE,
     _TEMPLATE_CLASS_ABSTRACT,
+    _TEMPLATE_CLASS_CONCRETE_SLOTS,
+    _TEMPLATE_CLASS_ABSTRACT_SLOTS,
     _TEMPLATE_CLASS_PSTR,
     _TEMPLATE_ENUM,
     _TEMPLATE_CLASS_COMPUTED_PROPERTY
@@ -52,6 +61,11 @@ _TEMPLATES = gu.load_templates(_LANG, (
 class PackageTypeSetGenerator(Generator):
     """Generates code to represent an ontology as a set of types.
 
+    When the slots option is set classes declare __slots__ & initialise
+    inherited properties directly rather than via super().__init__.  When the
+    lazy option is set type keys are set inline as type_info is not imported
+    upon package import.
+
     """
     def on_package_parse(self, ctx):
         """Event handler for the package parse event.
@@ -61,27 +75,36 @@ class PackageTypeSetGenerator(Generator):
         """
         ctx.code.append(
             (
-                _emit_module_typeset_for_pkg(ctx.ontology, ctx.pkg),
+                _emit_module_typeset_for_pkg(ctx.ontology, ctx.pkg,
+                                             ctx.options.get('slots', False),
+                                             ctx.options.get('lazy', False)),
                 pgu.get_ontology_directory(ctx),
                 pgu.get_package_module_file_name(ctx.pkg, 'typeset')
             )
         )
 
 
-def _emit_module_typeset_for_pkg(o, p):
+def _emit_module_typeset_for_pkg(o, p, slots=False, type_keys=False):
     """Emits typeset module for an ontology package.
 
     """
-    def emit_imports():
-        def get_code(ap):
-            return "import {} as {}{}".format(
-                pgu.get_package_module_name(ap, 'typeset'),
-                ap.op_name,
-                gu.emit_line_return())
+    def get_imports():
+        # Slotted classes also initialise inherited meta properties.
+        result = set(p.associated_for_import)
+        if slots:
+            result.update(prp.type.package for c in p.classes for prp in c.inherited_properties
+                          if prp.name == "meta" and prp.type.package != p)
 
-            return code
+        return result
 
-        return gu.emit(p.associated_for_import, get_code)
+
+    def emit_imports():
+        w = CodeWriter()
+        for line in sorted("import {} as {}".format(pgu.get_package_module_name(ap, 'typeset'), ap.op_name)
+                           for ap in get_imports()):
+            w.write_line(line)
+
+        return w.getvalue()
 
 
     def get_classes(p):
@@ -105,25 +128,33 @@ def _emit_module_typeset_for_pkg(o, p):
 
 
     def emit_types():
-        def get_code(t):
-            if isinstance(t, core.Class):
-                code = _emit_snippet_class(t)
-            else:
-                code = _emit_snippet_enum(t)
-            code += gu.emit_line_return(2)
+        # N.B. classes are written in dependency order, enums in code order.
+        w = CodeWriter()
+        for c in get_classes(p):
+            _write_snippet_class(w, c, slots)
+            w.write_line_return(2)
+        for code in sorted(_emit_snippet_enum(e) for e in p.enums):
+            w.write(code).write_line_return(2)
+
+        return w.getvalue()
 
-            return code
 
-        return gu.emit(get_classes(p), get_code, sort=False) + \
-               gu.emit(p.enums, get_code)
+    def emit_type_keys():
+        w = CodeWriter()
+        w.write_line("# Set inline type keys & identifiers.")
+        for t in sorted(p.classes + p.enums, key=lambda t: t.op_name):
+            w.write_line('{0}.type_key = "{1}.{2}.{3}"'.format(t.op_name, o.op_name, o.op_version, t.op_full_name))
+            w.write_line('{0}.type_id = {1}'.format(t.op_name, t.type_id))
 
+        return w.getvalue()
 
-    code = _TEMPLATES[_TEMPLATE_TYPESET]
-    code = code.replace('{imports}', emit_imports())
-    code = code.replace('{types}', emit_types())
-    code = code.replace('{package-name}', p.op_name)
 
-    return code
+    return _TEMPLATES[_TEMPLATE_TYPESET].substitute({
+        'imports': emit_imports(),
+        'types': emit_types(),
+        'type-keys': emit_type_keys() if type_keys else "",
+        'package-name': p.op_name
+        })
 
 
 def _emit_snippet_enum(e):
@@ -131,117 +162,150 @@ def _emit_snippet_enum(e):
 
     """
     def emit_members():
-        def get_code(m):
-            code = gu.emit_line_return()
-            code += gu.emit_indent(2)
-            code += '"{}"'.format(m.name)
+        w = CodeWriter()
+        for idx, member in enumerate(sorted('"{}"'.format(m.name) for m in e.members)):
+            if idx:
+                w.write(",")
+            w.write_line_return().write_indent(2).write(member)
+        w.write_line_return().write_indent(2)
+
+        return w.getvalue()
+
+    return _TEMPLATES[_TEMPLATE_ENUM].substitute({
+        'enum-name': e.op_name,
+        'enum-doc-string': e.doc_string,
+        'enum-is-open': str(e.is_open),
+        'enum-members': emit_members() if e.members else ""
+        })
+
+
+def _write_snippet_class(w, c, slots=False):
+    """Writes code corresponding to a python class."""
+    if slots:
+        template = _TEMPLATE_CLASS_ABSTRACT_SLOTS if c.is_abstract else _TEMPLATE_CLASS_CONCRETE_SLOTS
+    else:
+        template = _TEMPLATE_CLASS_ABSTRACT if c.is_abstract else _TEMPLATE_CLASS_CONCRETE
 
-            return code
+    w.write_template(_TEMPLATES[template], {
+        'class-name': c.op_name,
+        'base-class-name': c.op_base_name,
+        'class-doc-string': _emit_snippet_class_doc_string(c),
+        'class-slots': _emit_snippet_class_slots(c) if slots else "",
+        'class_constants': _emit_snippet_class_property_constants(c, slots),
+        'class-properties': _emit_snippet_class_properties(c, slots),
+        'class-computed-properties': _emit_snippet_class_computed_properties(c),
+        'class-pstr': _emit_snippet_class_pstr(c)
+        })
 
-        code = gu.emit(e.members, get_code, joiner=",")
-        code += gu.emit_line_return()
-        code += gu.emit_indent(2)
 
-        return code
+def _emit_snippet_class_pstr(c):
+    """Emits class print string.
 
-    code = _TEMPLATES[_TEMPLATE_ENUM]
-    code = code.replace('{enum-name}', e.op_name)
-    code = code.replace('{enum-doc-string}', e.doc_string)
-    code = code.replace('{enum-is-open}', str(e.is_open))
-    code = code.replace('{enum-members}', emit_members() if e.members else "")
+    """
+    if not c.pstr:
+        return ""
 
-    return code
+    return _TEMPLATES[_TEMPLATE_CLASS_PSTR].substitute({
+        'text': c.pstr.text,
+        'fields': ", ".join(["self.{}".format(f) for f in c.pstr.fields])
+        })
 
 
-def _emit_snippet_class(c):
-    """Emits code corresponding to a python class."""
-    # Open template.
-    if c.is_abstract:
-        code = _TEMPLATES[_TEMPLATE_CLASS_ABSTRACT]
-    else:
-        code = _TEMPLATES[_TEMPLATE_CLASS_CONCRETE]
+def _emit_snippet_class_doc_string(c):
+    """Emits class doc string."""
+    w = CodeWriter(level=1)
+    w.write_line_return(2).write_indent()
+    if c.doc_string:
+        w.write(c.doc_string).write_line_return(2).write_indent()
 
-    # Generate code.
-    code = code.replace('{class-name}', c.op_name)
-    code = code.replace('{base-class-name}', c.op_base_name)
-    code = code.replace('{class-doc-string}', _emit_snippet_class_doc_string(c))
-    code = code.replace('{class_constants}', _emit_snippet_class_property_constants(c))
-    code = code.replace('{class-properties}', _emit_snippet_class_properties(c))
-    code = code.replace('{class-computed-properties}', _emit_snippet_class_computed_properties(c))
-    code = code.replace('{class-pstr}', _emit_snippet_class_pstr(c))
+    return w.getvalue()
 
-    return code
 
+def _emit_snippet_class_slots(c):
+    """Emits class __slots__, i.e. properties not already slotted by a base class."""
+    inherited = {prp.name for prp in c.inherited_properties}
+    slots = sorted({pgu.get_property_name(prp) for prp in c.all_properties if prp.name not in inherited})
+    if not slots:
+        return "()"
 
-def _emit_snippet_class_pstr(c):
-    """Emits class print string.
-
-    """
-    code = ""
-    if c.pstr:
-        code = _TEMPLATES[_TEMPLATE_CLASS_PSTR]
-        code = code.replace('{text}', c.pstr.text)
-        code = code.replace('{fields}', ", ".join(["self.{}".format(f) for f in c.pstr.fields]))
+    w = CodeWriter()
+    w.write("(")
+    for slot in slots:
+        w.write_line_return().write_indent(2).write("'{}',".format(slot))
+    w.write_line_return().write_indent().write(")")
 
-    return code
+    return w.getvalue()
 
 
-def _emit_snippet_class_doc_string(c):
-    """Emits class doc string."""
-    doc_string = "" if not c.doc_string else c.doc_string
+def _get_class_initialisers(c):
+    """Returns map of property name to (property, constant value) assigned by a slotted class constructor.
 
-    if doc_string:
-        doc_string = "{0}{1}{2}".format(doc_string,
-                                        gu.emit_line_return(2),
-                                        gu.emit_indent())
+    Mirrors the super().__init__ chain, i.e. sub-class properties & constants
+    override those of base classes, so that each property is assigned once only.
 
-    return "{0}{1}{2}".format(gu.emit_line_return(2),
-                              gu.emit_indent(),
-                              doc_string)
+    """
+    result = {}
+    for cls in reversed((c, ) + c.bases):
+        for prp in cls.properties:
+            result[prp.name] = (prp, None)
+        for name, value in cls.constants:
+            prp = cls.get_property(name)
+            if prp is not None:
+                result[name] = (prp, value)
 
+    return result
 
 
-def _emit_snippet_class_properties(c):
+def _emit_snippet_class_properties(c, slots=False):
     """Emits set of class properties."""
     def get_code(p):
-        return "{0}{1}{2}# {3} ({4}){5}".format(
-            gu.emit_indent(2),
-            pgu.get_property_ctor(p),
-            ''.ljust(50 - len(pgu.get_property_ctor(p))),
+        ctor = pgu.get_property_ctor(p, c.package)
+        return "{0}{1}# {2} ({3})".format(
+            ctor,
+            ''.ljust(50 - len(ctor)),
             pgu.get_type_doc_name(p.type),
-            p.cardinality,
-            gu.emit_line_return()
+            p.cardinality
         )
 
-    return gu.emit(c.properties, get_code)
+    if slots:
+        properties = [prp for prp, value in _get_class_initialisers(c).values() if value is None]
+    else:
+        properties = c.properties
+
+    w = CodeWriter(level=2)
+    for line in sorted(get_code(p) for p in properties):
+        w.write_line(line)
+
+    return w.getvalue()
 
 
 def _emit_snippet_class_computed_properties(c):
     """Emits set of class computed properties."""
     def get_code(cp):
-        # Open template.
-        code = _TEMPLATES[_TEMPLATE_CLASS_COMPUTED_PROPERTY]
-
-        # Generate code.
-        code = code.replace('{computed-property-name}', cp.name)
-        code = code.replace('{computed-property-computation}', cp.computation)
-
-        return code
+        return _TEMPLATES[_TEMPLATE_CLASS_COMPUTED_PROPERTY].substitute({
+            'computed-property-name': cp.name,
+            'computed-property-computation': cp.computation
+            })
 
     return gu.emit(c.computed_properties, get_code)
 
 
-def _emit_snippet_class_property_constants(c):
+def _emit_snippet_class_property_constants(c, slots=False):
     """Emits set of class property constants."""
-    def get_code(cnt):
-        prp = c.get_property(cnt[0])
-        if prp is not None:
-            return '{0}self.{1} = {2}("{3}"){4}'.format(
-                gu.emit_indent(2),
-                cnt[0],
-                pgu.get_type_functional_name(prp.type),
-                cnt[1],
-                gu.emit_line_return()
-            )
+    def get_code(prp, value):
+        return 'self.{0} = {1}("{2}")'.format(
+            prp.name,
+            pgu.get_type_functional_name(prp.type),
+            value
+        )
+
+    if slots:
+        constants = [(prp, value) for prp, value in _get_class_initialisers(c).values() if value is not None]
+    else:
+        constants = [(c.get_property(name), value) for name, value in c.constants]
+
+    w = CodeWriter(level=2)
+    for line in sorted(get_code(prp, value) for prp, value in constants if prp is not None):
+        w.write_line(line)
 
-    return gu.emit(c.constants, get_code)
+    return w.getvalue()
@@ -3,6 +3,8 @@
 """Encapsualtes a set of python specific name conversion operations.
 
 """
+import re
+
 import tornado.template as template
 
 from esdoc_mp.ontologies.generators import generator_utils as gu
@@ -44,6 +46,47 @@ _NULL_VALUE = 'None'
 # Iterable null value.
 _NULL_VALUE_COLLECTION = '[]'
 
+# Type information tables exported by a type_info module.
+TYPE_INFO_EXPORTS = (
+    'PACKAGES',
+    'DOCUMENT_TYPES',
+    'CLASSES',
+    'CLASS_PROPERTIES',
+    'CLASS_OWN_PROPERTIES',
+    'BASE_CLASSES',
+    'BASE_CLASSED',
+    'SUB_CLASSED',
+    'SUB_CLASSES',
+    'ENUMS',
+    'CONSTRAINTS',
+    'KEYS',
+    'DOC_STRINGS',
+    'TYPES_BY_KEY',
+    'TYPE_IDS',
+    'TYPES_BY_ID',
+    'PROPERTY_INFO',
+    'SUB_CLASS_CLOSURES'
+)
+
+# Type information tables declared by a type_info module (exported or otherwise).
+TYPE_INFO_TABLES = TYPE_INFO_EXPORTS + (
+    'CLASS_HIERACHY_DEPTH',
+    'TOTAL_CLASS_PROPERTIES',
+    'TOTAL_CONSTRAINTS',
+    'TOTAL_ENUM_MEMBERS',
+    'TYPES'
+)
+
+# Templates superseded by lazy import proxies when the lazy option is set.
+_LAZY_TEMPLATES = {
+    '__init__.tornado',
+    'type_info.tornado',
+    'typeset.tornado'
+}
+
+# Decoding xpath element step reg-ex, e.g. child::cim:shortName.
+RE_XPATH_ELEMENT = re.compile(r'^(child::|self::)?([a-zA-Z]+):([a-zA-Z0-9_\-]+)$')
+
 
 def _strip(name):
     """Returns stripped name.
@@ -207,12 +250,15 @@ def _get_class_base_name(c):
         return get_full_type_name(c.base)
 
 
-def get_property_ctor(p):
+def get_property_ctor(p, pkg=None):
     """Converts class property to a python property constructor declaration.
 
+    :param esdoc_mp.ontologies.core.Property p: Class property.
+    :param esdoc_mp.ontologies.core.Package pkg: Package within which the constructor is declared (defaults to property package).
+
     """
     return 'self.{0} = {1}'.format(get_property_name(p),
-                                   get_property_default_value(p))
+                                   get_property_default_value(p, pkg))
 
 
 def get_property_reference_ctor(p):
@@ -236,14 +282,17 @@ def get_property_field_name(name):
     return _PROPERTY_FIELD_PREFIX + _strip(name)
 
 
-def get_property_default_value(p):
+def get_property_default_value(p, pkg=None):
     """Returns property default value.
 
+    :param esdoc_mp.ontologies.core.Property p: Class property.
+    :param esdoc_mp.ontologies.core.Package pkg: Package within which the value is declared (defaults to property package).
+
     """
     # Return value based upon property type:
     # ... meta information;
     if p.name == "meta":
-        if p.package == p.type.package:
+        if (pkg or p.package) == p.type.package:
             return "{0}()".format(get_type_name(p.type))
         else:
             return "{0}.{1}()".format(get_package_name(p.type.package),
@@ -378,6 +427,57 @@ def get_module_file_name(name):
     return name + FILE_EXTENSION
 
 
+def get_decoder_function_name(name):
+    """Converts class name to a decoder function name.
+
+    :param str name: Class name.
+
+    """
+    return 'decode_{0}'.format(get_type_func_name(name))
+
+
+def get_document_tags(o):
+    """Returns map of document classes to document root element names.
+
+    Root element names are derived from self axis decodings, e.g. self::cim:gridSpec,
+    otherwise from the class name.  Where classes share a self axis element name,
+    the class whose name matches it retains it, the others fall back to their name.
+
+    :param esdoc_mp.ontologies.core.Ontology o: An ontology formatted for python.
+
+    """
+    tags = {}
+    for c in o.entities:
+        tags[c] = convert_to_pascal_case(c.name)
+        for dc in c.all_decodings:
+            match = RE_XPATH_ELEMENT.match(dc.decoding or '')
+            if match and match.group(1) == 'self::':
+                tags[c] = match.group(3)
+
+    return {c: convert_to_pascal_case(c.name)
+               if tag != convert_to_pascal_case(c.name) and tags.values().count(tag) > 1 else tag
+            for c, tag in tags.items()}
+
+
+def get_type_info_names(names):
+    """Returns code listing a set of type information table names, one per line.
+
+    :param tuple names: Type information table names.
+
+    """
+    return ",\n".join("    '{0}'".format(name) for name in names)
+
+
+def is_template_required(ctx, template):
+    """Predicate determining whether code generation from a template is required.
+
+    :param GeneratorContext ctx: Generation context information.
+    :param str template: Name of a template file.
+
+    """
+    return not (ctx.options.get('lazy') and template in _LAZY_TEMPLATES)
+
+
 def format(o):
     """Pythonizes ontology names.
 
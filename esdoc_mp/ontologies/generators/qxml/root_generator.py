@@ -15,7 +15,6 @@ from esdoc_mp.ontologies.generators.qxml import utils as qgu
 
 from lxml import etree as et
 from functools import reduce
-from errno import EEXIST as PATH_EXISTS
 import datetime
 import os
 
@@ -210,13 +209,10 @@ class RootGenerator(Generator):
         """
 
         output_filepath = qgu.get_ontology_path(ctx)
-        if not os.path.exists(os.path.dirname(output_filepath)):
-            try:
-                os.makedirs(os.path.dirname(output_filepath))
-            except OSError as error:  # handle race condition, as per http://stackoverflow.com/a/12517490
-                if error.errno != PATH_EXISTS:
-                    raise error
-        with open(output_filepath, 'w') as f:
-            qxml_content = et.tostring(ctx.node, pretty_print=True)
-            f.write(qxml_content)
-        f.closed
+        ctx.code.append(
+            (
+                et.tostring(ctx.node, pretty_print=True),
+                os.path.dirname(output_filepath),
+                os.path.basename(output_filepath)
+            )
+        )
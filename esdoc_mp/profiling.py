@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: esdoc_mp.profiling
+   :platform: Unix, Windows
+   :synopsis: Per stage timers & counters used to profile a generation run.
+
+.. moduleauthor:: Mark Conway-Greenslade <momipsl@ipsl.jussieu.fr>
+
+
+"""
+import contextlib
+import functools
+import json
+import platform
+import time
+
+
+
+# Flag indicating whether instrumentation is active.
+_enabled = False
+
+# Stack of active scopes, e.g. schema, language.
+_scopes = []
+
+# Map of stage name -> [call count, elapsed time].
+_timers = {}
+
+# Map of counter name -> count.
+_counters = {}
+
+
+def enable():
+    """Activates instrumentation.
+
+    """
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    """Deactivates instrumentation.
+
+    """
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    """Returns flag indicating whether instrumentation is active.
+
+    """
+    return _enabled
+
+
+def reset():
+    """Clears collected timings & counts.
+
+    """
+    _timers.clear()
+    _counters.clear()
+
+
+def _get_name(name):
+    """Returns name qualified by active scopes.
+
+    """
+    return ".".join(_scopes + [name])
+
+
+@contextlib.contextmanager
+def scope(name):
+    """Qualifies names of stages & counters recorded within the block.
+
+    :param str name: Scope name, e.g. cim.v2.
+
+    """
+    _scopes.append(name)
+    try:
+        yield
+    finally:
+        _scopes.pop()
+
+
+@contextlib.contextmanager
+def timer(name):
+    """Times execution of a stage.
+
+    :param str name: Stage name.
+
+    """
+    if not _enabled:
+        yield
+        return
+
+    start = time.time()
+    try:
+        yield
+    finally:
+        record(name, time.time() - start)
+
+
+def timed(name):
+    """Decorator timing each invocation of a function as a stage.
+
+    :param str name: Stage name.
+
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with timer(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def record(name, elapsed, count=1):
+    """Records time spent within a stage.
+
+    :param str name: Stage name.
+    :param float elapsed: Elapsed time (seconds).
+    :param int count: Number of stage invocations.
+
+    """
+    if not _enabled:
+        return
+
+    stats = _timers.setdefault(_get_name(name), [0, 0.0])
+    stats[0] += count
+    stats[1] += elapsed
+
+
+def increment(name, count=1):
+    """Increments a counter.
+
+    :param str name: Counter name.
+    :param int count: Increment.
+
+    """
+    if not _enabled:
+        return
+
+    name = _get_name(name)
+    _counters[name] = _counters.get(name, 0) + count
+
+
+def get_stats():
+    """Returns collected timings & counts.
+
+    :returns: Timers & counters keyed by name.
+    :rtype: dict
+
+    """
+    return {
+        'timers': {k: {'count': v[0], 'elapsed': v[1]} for k, v in _timers.items()},
+        'counters': dict(_counters)
+    }
+
+
+def merge(stats):
+    """Merges timings & counts collected elsewhere, e.g. within a worker process.
+
+    :param dict stats: Stats returned by get_stats.
+
+    """
+    for name, timer_ in stats['timers'].items():
+        current = _timers.setdefault(name, [0, 0.0])
+        current[0] += timer_['count']
+        current[1] += timer_['elapsed']
+    for name, count in stats['counters'].items():
+        _counters[name] = _counters.get(name, 0) + count
+
+
+def write_report(fpath, **info):
+    """Writes a JSON profiling report.
+
+    :param str fpath: Path to report file.
+    :param dict info: Run information, e.g. schemas, languages.
+
+    """
+    import esdoc_mp
+
+    report = get_stats()
+    report['info'] = dict(info,
+                          esdoc_mp=esdoc_mp.__version__,
+                          python=platform.python_version(),
+                          created=time.strftime("%Y-%m-%dT%H:%M:%S"))
+
+    with open(fpath, 'w') as f:
+        f.write(json.dumps(report, indent=4, sort_keys=True))
@@ -9,6 +9,10 @@
 
 
 """
+import hashlib
+import os
+
+
 
 class ESDOC_MP_Exception(Exception):
     """Default library exception class.
@@ -53,6 +57,39 @@ def log(msg):
         print("ES-DOC-MP :: {}".format(msg))
 
 
+def get_hash(content):
+    """Returns hash of some content.
+
+    :param str content: Content to be hashed.
+
+    """
+    if isinstance(content, unicode):
+        content = content.encode('utf-8')
+
+    return hashlib.sha1(content).hexdigest()
+
+
+def get_directory_hash(dir_, extensions, recursive=True):
+    """Returns hash of the files within a directory tree.
+
+    :param str dir_: Directory to be hashed.
+    :param tuple extensions: Extensions of files to be hashed.
+    :param bool recursive: Flag indicating whether files within sub-directories are hashed.
+
+    """
+    result = hashlib.sha1()
+    for root, dirs, files in sorted(os.walk(dir_)):
+        if not recursive and root != dir_:
+            continue
+        for fname in sorted(f for f in files if f.endswith(extensions)):
+            fpath = os.path.join(root, fname)
+            result.update(os.path.relpath(fpath, dir_))
+            with open(fpath, 'r') as f:
+                result.update(f.read())
+
+    return result.hexdigest()
+
+
 def str_to_camel_case(target, separator='_'):
     """Converts passed name to camel case.
 
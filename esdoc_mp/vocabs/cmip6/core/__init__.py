@@ -1,2 +1,4 @@
 from model import Vocab
-from parser import VocabParser
\ No newline at end of file
+from parser import VocabParser
+from index import get_index
+from index import VocabIndex
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: index.py
+   :platform: Unix, Windows
+   :synopsis: Index of CMIP6 vocab definitions keyed by id.
+
+.. moduleauthor:: Mark Conway-Greenslade <momipsl@ipsl.jussieu.fr>
+
+
+"""
+import bisect
+import gzip
+import json
+import os
+
+import esdoc_mp
+from esdoc_mp.utils import get_directory_hash
+from esdoc_mp.utils import get_hash
+from esdoc_mp.vocabs.cmip6 import schema
+from esdoc_mp.vocabs.cmip6.core.parser import VocabParser
+
+
+
+# Attributes of an indexed node that are persisted.
+_PERSISTED = ('id', 'style_type', 'description', 'url')
+
+# Directories containing sources from which an index is built, i.e. vocab definitions & vocab model.
+_SOURCE_DIRS = (
+    os.path.dirname(os.path.abspath(schema.__file__)),
+    os.path.dirname(os.path.abspath(__file__))
+)
+
+# Loaded index cache.
+_INDEX = {}
+
+
+class IndexedNode(object):
+    """A vocab node loaded from a persisted index.
+
+    """
+    def __init__(self, id, style_type, description, url):
+        """Instance constructor.
+
+        """
+        self.description = description
+        self.id = id
+        self.style_type = style_type
+        self.url = url
+
+
+    def __repr__(self):
+        """Instance string representation.
+
+        """
+        return self.id
+
+
+class VocabIndex(VocabParser):
+    """An index of vocab nodes (from vocab down to enum choices) keyed by id.
+
+    Lookups by id are O(1), lookups by id prefix are O(log n) (plus number of matches).
+
+    """
+    def __init__(self, realm_filter=None):
+        """Instance constructor.
+
+        :param str realm_filter: Name of realm to which index is restricted.
+
+        """
+        super(VocabIndex, self).__init__(realm_filter)
+        self.key = None
+        self.nodes = {}
+        self._ids = []
+        self._search_text = {}
+
+
+    def __contains__(self, id_):
+        """Returns flag indicating whether a node is indexed.
+
+        """
+        return id_ in self.nodes
+
+
+    def __len__(self):
+        """Returns number of indexed nodes.
+
+        """
+        return len(self.nodes)
+
+
+    def parse(self):
+        """Builds index via a vocabulary parse.
+
+        """
+        super(VocabIndex, self).parse()
+        self.key = get_key()
+        self._set_lookups()
+
+        return self
+
+
+    def on_vocab_parse(self, vocab):
+        """On vocabulary parse event handler.
+
+        """
+        self.nodes[vocab.id] = vocab
+
+
+    def on_realm_parse(self, realm):
+        """On realm parse event handler.
+
+        """
+        self.nodes[realm.id] = realm
+
+
+    def on_process_parse(self, realm, process):
+        """On process parse event handler.
+
+        """
+        self.nodes[process.id] = process
+
+
+    def on_subprocess_parse(self, process, subprocess):
+        """On sub-process parse event handler.
+
+        """
+        self.nodes[subprocess.id] = subprocess
+
+
+    def on_detail_parse(self, owner, detail):
+        """On detail parse event handler.
+
+        """
+        self.nodes[detail.id] = detail
+
+
+    def on_detail_property_parse(self, owner, detail_property):
+        """On detail property parse event handler.
+
+        """
+        self.nodes[detail_property.id] = detail_property
+        for choice in detail_property.choices:
+            self.nodes[choice.id] = choice
+
+
+    def get(self, id_):
+        """Returns node with matching id.
+
+        :param str id_: Node id, e.g. cmip6.ocean.advection.momentum.scheme.type.
+
+        """
+        return self.nodes.get(id_)
+
+
+    def find(self, prefix):
+        """Returns nodes whose id starts with a prefix.
+
+        :param str prefix: Id prefix, e.g. cmip6.ocean.advection.
+
+        """
+        start = bisect.bisect_left(self._ids, prefix)
+        end = bisect.bisect_left(self._ids, prefix + u"\uffff", start)
+
+        return [self.nodes[i] for i in self._ids[start:end]]
+
+
+    def search(self, text):
+        """Returns nodes whose id or description contains some text (case insensitive).
+
+        :param str text: Text to search for.
+
+        """
+        text = text.lower()
+
+        return [self.nodes[i] for i in self._ids if text in self._search_text[i]]
+
+
+    def save(self, fpath):
+        """Persists index to a compact JSON file (gzipped if file extension is .gz).
+
+        :param str fpath: Path to index file.
+
+        """
+        rows = [[getattr(self.nodes[i], k, None) for k in _PERSISTED] for i in self._ids]
+        with _open(fpath, 'w') as f:
+            f.write(json.dumps({'key': self.key, 'nodes': rows}, separators=(',', ':')))
+
+
+    @classmethod
+    def load(cls, fpath):
+        """Loads an index previously persisted via save.
+
+        N.B. loaded nodes are IndexedNode records rather than vocab model objects.
+
+        :param str fpath: Path to index file.
+
+        """
+        with _open(fpath, 'r') as f:
+            data = json.loads(f.read())
+
+        # N.B. an index persisted without a key is left empty, i.e. it is stale.
+        index = cls()
+        if isinstance(data, dict):
+            index.key = data['key']
+            index.nodes = {row[0]: IndexedNode(*row) for row in data['nodes']}
+        index._set_lookups()
+
+        return index
+
+
+    def _set_lookups(self):
+        """Sets sorted ids & search text used by prefix & text lookups.
+
+        """
+        self._ids = sorted(self.nodes)
+        self._search_text = {i: u"{0}\n{1}".format(i, n.description or "").lower()
+                             for i, n in self.nodes.items()}
+
+
+def get_key():
+    """Returns key of the sources from which an index is built, i.e. a persisted index is stale if its key differs.
+
+    """
+    return get_hash("|".join([esdoc_mp.__version__] + [get_directory_hash(i, ('.py', )) for i in _SOURCE_DIRS]))
+
+
+def get_index(fpath=None):
+    """Returns vocab index, loaded from (or persisted to) a file if specified.
+
+    Indexes are cached, i.e. built or loaded once only.  A persisted index is rebuilt
+    (and re-persisted) if the vocab definitions or library version have since changed.
+
+    N.B. the node types differ depending upon how an index was obtained:
+    - a parsed index holds vocab model objects (Vocab, Realm, Process ... EnumChoice);
+    - a loaded index holds IndexedNode records, i.e. id, style_type, description & url only.
+
+    :param str fpath: Path to a persisted index file.
+
+    :returns: Vocab index.
+    :rtype: VocabIndex
+
+    """
+    if fpath not in _INDEX:
+        index = None
+        if fpath is not None and os.path.exists(fpath):
+            index = VocabIndex.load(fpath)
+            if index.key != get_key():
+                index = None
+        if index is None:
+            index = VocabIndex().parse()
+            if fpath is not None:
+                index.save(fpath)
+        _INDEX[fpath] = index
+
+    return _INDEX[fpath]
+
+
+def _open(fpath, mode):
+    """Opens an index file."""
+    return gzip.open(fpath, mode + 'b') if fpath.endswith('.gz') else open(fpath, mode)
@@ -12,6 +12,7 @@
 import inspect
 
 from esdoc_mp.vocabs.cmip6 import schema
+from esdoc_mp.vocabs.cmip6.core.source_index import get_source_index
 
 
 
@@ -19,9 +20,34 @@ from esdoc_mp.vocabs.cmip6 import schema
 _URL = "https://github.com/ES-DOC/esdoc-mp/blob/master/esdoc_mp/vocabs/"
 
 
+class _memoized_property(object):
+    """Decorator of a property whose value is computed upon first access only.
+
+    """
+    def __init__(self, func):
+        """Instance constructor.
+
+        """
+        self.func = func
+        self.__doc__ = func.__doc__
+
+
+    def __get__(self, instance, owner):
+        """Computes property value & caches it within instance dictionary (thereby bypassing descriptor).
+
+        """
+        if instance is None:
+            return self
+        value = instance.__dict__[self.func.__name__] = self.func(instance)
+
+        return value
+
+
 class Vocab(object):
     """Wraps the definitions of the CMIP6 vocab.
 
+    Child definitions are wrapped upon first access.
+
     """
     def __init__(self):
         """Instance constructor.
@@ -31,7 +57,31 @@ class Vocab(object):
         self.id = "cmip6"
         self.style_type = "vocab"
         self.url = "{}{}".format(_URL, self.id.replace(".", "/"))
-        self.realms = [Realm(self, i) for i in schema.realms]
+        self._realms = {}
+
+
+    @property
+    def realms(self):
+        """Returns set of realms.
+
+        """
+        return self.get_realms()
+
+
+    def get_realms(self, name=None):
+        """Returns set of realms, only matching realms are wrapped.
+
+        :param str name: Name of a realm (if None then all realms are returned).
+
+        """
+        result = []
+        for module in schema.realms:
+            if name is None or _get_name(module) == name:
+                if module not in self._realms:
+                    self._realms[module] = Realm(self, module)
+                result.append(self._realms[module])
+
+        return result
 
 
 class Realm(object):
@@ -43,21 +93,30 @@ class Realm(object):
 
         """
         self.description = "{}.".format(module.__doc__.split(".")[0])
-        self.id = "{}.{}".format(owner.id, module.__name__.split(".")[-1])
-        self.name = module.__name__.split(".")[-1]
+        self.id = "{}.{}".format(owner.id, _get_name(module))
+        self.line_begin, self.line_end = get_source_index(module).get_line_numbers()
+        self.module = module
+        self.name = _get_name(module)
         self.style_type = "realm"
         self.url = "{}{}".format(_URL, self.id.replace(".", "/"))
-        self.processes = [Process(self, i) for i in module.processes]
 
 
-    @property
+    @_memoized_property
+    def processes(self):
+        """Returns set of processes.
+
+        """
+        return [Process(self, i) for i in self.module.processes]
+
+
+    @_memoized_property
     def notes(self):
         """Returns notes.
 
         """
         return [
             ("Description", self.description),
-            ("ID", self.id.lower().replace(" ", "-").replace("_", "-")),
+            ("ID", _get_note_id(self.id)),
             ("Python Definition", self.url)
         ]
 
@@ -71,22 +130,30 @@ class Process(object):
 
         """
         self.description = "{}.".format(module.__doc__.split(".")[0])
-        self.id = "{}.{}".format(owner.id, module.__name__.split(".")[-1])
-        self.name = module.__name__.split(".")[-1]
+        self.id = "{}.{}".format(owner.id, _get_name(module))
+        self.line_begin, self.line_end = get_source_index(module).get_line_numbers()
+        self.module = module
+        self.name = _get_name(module)
         self.style_type = "process"
         self.url = "{}{}".format(_URL, self.id.replace(".", "/"))
 
-        self.sub_processes = [SubProcess(self, i) for i in module.sub_processes]
 
+    @_memoized_property
+    def sub_processes(self):
+        """Returns set of sub-processes.
 
-    @property
+        """
+        return [SubProcess(self, i) for i in self.module.sub_processes]
+
+
+    @_memoized_property
     def notes(self):
         """Returns notes.
 
         """
         return [
             ("Description", self.description),
-            ("ID", self.id.lower().replace(" ", "-").replace("_", "-")),
+            ("ID", _get_note_id(self.id)),
             ("Python Definition", self.url)
         ]
 
@@ -100,23 +167,32 @@ class SubProcess(object):
 
         """
         self.description = "{}.".format(module.__doc__.split(".")[0])
-        self.id = "{}.{}".format(owner.id, module.__name__.split(".")[-1])
+        self.id = "{}.{}".format(owner.id, _get_name(module))
+        self.line_begin, self.line_end = get_source_index(module).get_line_numbers()
         self.module = module
-        self.name = module.__name__.split(".")[-1]
+        self.name = _get_name(module)
         self.style_type = "sub-process"
         self.url = "{}{}.py".format(_URL, self.id.replace(".", "/"))
-        self.details = [Detail(self, m[1], m[0])
-                        for m in inspect.getmembers(module)
-                        if inspect.isfunction(m[1]) and not m[0].startswith("_")]
 
-    @property
+
+    @_memoized_property
+    def details(self):
+        """Returns set of details.
+
+        """
+        return [Detail(self, m[1], m[0])
+                for m in inspect.getmembers(self.module)
+                if inspect.isfunction(m[1]) and not m[0].startswith("_")]
+
+
+    @_memoized_property
     def notes(self):
         """Returns notes.
 
         """
         return [
             ("Description", self.description),
-            ("ID", self.id.lower().replace(" ", "-").replace("_", "-")),
+            ("ID", _get_note_id(self.id)),
             ("Python Definition", self.url)
         ]
 
@@ -130,23 +206,32 @@ class Detail(object):
 
         """
         self.description = "{}.".format(func.__doc__.split(".")[0])
+        self.func = func
         self.id = "{}.{}".format(owner.id, name)
         self.name = name
         self.owner = owner
         self.style_type = "detail"
-        self.line_begin, self.line_end = _get_line_numbers(owner.module, name)
+        self.line_begin, self.line_end = get_source_index(owner.module).get_line_numbers(name)
         self.url = "{}#L{}-L{}".format(owner.url, self.line_begin, self.line_end)
-        self.properties = [DetailProperty(self, i.replace("_", "-"), v)
-                           for i, v in func().items()]
 
-    @property
+
+    @_memoized_property
+    def properties(self):
+        """Returns set of detail properties, i.e. detail definition function is invoked upon first access.
+
+        """
+        return [DetailProperty(self, i.replace("_", "-"), v)
+                for i, v in self.func().items()]
+
+
+    @_memoized_property
     def notes(self):
         """Returns notes.
 
         """
         return [
             ("Description", self.description),
-            ("ID", self.id.lower().replace(" ", "-").replace("_", "-")),
+            ("ID", _get_note_id(self.id)),
             ("Python Definition", self.url)
         ]
 
@@ -163,21 +248,29 @@ class DetailProperty(object):
         self.description = obj.get("description", None)
         self.id = "{}.{}".format(owner.id, name)
         self.name = name
+        self.obj = obj
         self.style_type = "detail-property"
         self.is_enum = obj['type'] == 'enum'
         self.type = obj['type']
-        self.choices = [EnumChoice(self, c[0], c[1])
-                        for c in obj.get('choices', [])]
 
 
-    @property
+    @_memoized_property
+    def choices(self):
+        """Returns set of enumeration choices.
+
+        """
+        return [EnumChoice(self, c[0], c[1])
+                for c in self.obj.get('choices', [])]
+
+
+    @_memoized_property
     def notes(self):
         """Returns notes.
 
         """
         return [
             ("Description", self.description),
-            ("ID", self.id.lower().replace(" ", "-").replace("_", "-")),
+            ("ID", _get_note_id(self.id)),
             ("Type", self.type),
             ("Cardinality", self.cardinality)
         ]
@@ -197,33 +290,22 @@ class EnumChoice(object):
         self.style_type = "enum-choice"
 
 
-    @property
+    @_memoized_property
     def notes(self):
         """Returns notes.
 
         """
         return [
             ("Description", self.description),
-            ("ID", self.id.lower().replace(" ", "-").replace("_", "-"))
+            ("ID", _get_note_id(self.id))
         ]
 
 
-def _get_line_numbers(module, func_name=None):
-    """Returns line numbers within which a definition is defined.
+def _get_name(module):
+    """Returns name of a vocab definition module."""
+    return module.__name__.split(".")[-1]
 
-    """
-    begin, end = 0, 0
-    with open(inspect.getfile(module).replace(".pyc", ".py"), 'r') as f:
-        if func_name is None:
-            end = len(f.readlines())
-        else:
-            for line_no, line in enumerate(f.readlines()):
-                if begin and line.startswith("def"):
-                    end = line_no - 2
-                    break
-                if not begin and line.startswith("def {}()".format(func_name)):
-                    begin = line_no + 1
-    if func_name and begin and not end:
-        end = line_no + 1
-
-    return begin, end
+
+def _get_note_id(id_):
+    """Returns an identifier formatted for display within notes."""
+    return id_.lower().replace(" ", "-").replace("_", "-")
@@ -38,11 +38,8 @@ class VocabParser(object):
             log("parsing vocabulary --> {}".format(vocab))
         self.on_vocab_parse(vocab)
 
-        # Parse child realms.
-        realms = vocab.realms
-        if self.realm_filter:
-            realms = [d for d in realms if self.realm_filter == d.name]
-        for realm in realms:
+        # Parse child realms (N.B. filtered realms are not wrapped).
+        for realm in vocab.get_realms(self.realm_filter or None):
             self._parse_realm(realm)
 
 
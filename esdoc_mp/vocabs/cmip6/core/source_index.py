@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: source_index.py
+   :platform: Unix, Windows
+   :synopsis: Index of source locations of CMIP6 vocab definitions.
+
+.. moduleauthor:: Mark Conway-Greenslade <momipsl@ipsl.jussieu.fr>
+
+
+"""
+import ast
+import inspect
+import os
+
+
+
+# Map of source file path -> (modification time, source index).
+_CACHE = {}
+
+
+class SourceIndex(object):
+    """Line numbers of the top level functions declared within a module's source file.
+
+    :ivar str fpath: Path to source file.
+    :ivar int line_count: Number of lines within source file.
+    :ivar dict functions: Map of function name -> (first line, last line).
+
+    """
+    def __init__(self, fpath):
+        """Instance constructor.
+
+        :param str fpath: Path to source file.
+
+        """
+        with open(fpath, 'r') as f:
+            source = f.read()
+        lines = source.splitlines()
+
+        self.fpath = fpath
+        self.line_count = len(lines)
+        self.functions = {}
+
+        # A function spans from its def (or first decorator) to the last line of code
+        # preceding the next top level statement.
+        nodes = ast.parse(source, fpath).body
+        for idx, node in enumerate(nodes):
+            if isinstance(node, ast.FunctionDef):
+                end = nodes[idx + 1].lineno - 1 if idx + 1 < len(nodes) else self.line_count
+                while end > node.lineno and _is_blank(lines[end - 1]):
+                    end -= 1
+                self.functions[node.name] = (node.lineno, end)
+
+
+    def get_line_numbers(self, func_name=None):
+        """Returns line numbers within which a definition is defined.
+
+        :param str func_name: Name of a function (if None then line numbers of entire module are returned).
+
+        :returns: First & last line numbers (0, 0 if function is not found).
+        :rtype: tuple
+
+        """
+        if func_name is None:
+            return 1, self.line_count
+
+        return self.functions.get(func_name, (0, 0))
+
+
+def get_source_index(module):
+    """Returns source index of a module, indexes are cached until their source file is modified.
+
+    :param module module: A vocab definition module.
+
+    :returns: Source index.
+    :rtype: SourceIndex
+
+    """
+    fpath = inspect.getfile(module)
+    if fpath.endswith(".pyc"):
+        fpath = fpath[:-1]
+    mtime = os.path.getmtime(fpath)
+
+    try:
+        cached_mtime, index = _CACHE[fpath]
+    except KeyError:
+        pass
+    else:
+        if cached_mtime == mtime:
+            return index
+
+    index = SourceIndex(fpath)
+    _CACHE[fpath] = (mtime, index)
+
+    return index
+
+
+def _is_blank(line):
+    """Returns flag indicating whether a line of source contains no code."""
+    line = line.strip()
+
+    return not line or line.startswith("#")
@@ -13,9 +13,11 @@ import argparse
 import json
 import os
 
-import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape
 
 from esdoc_mp.vocabs.cmip6.core import VocabParser
+from esdoc_mp.vocabs.cmip6.generators.utils import get_realm_names
+from esdoc_mp.vocabs.cmip6.generators.utils import map_realms
 
 
 
@@ -40,21 +42,31 @@ _ARGS.add_argument(
     type=str,
     default=None
     )
+_ARGS.add_argument(
+    "--jobs",
+    help="Number of realms to generate concurrently.",
+    dest="jobs",
+    type=int,
+    default=1
+    )
 
 
-_NOTES = """
-<html>
-  <head></head>
+_NOTES = """<html>
+  <head />
   <body>
     <dl>
         {}
     </dl>
   </body>
-</html>
-"""
+</html>"""
 
 _NOTE = "<dt><b>{}</b></dt><dd>{}</dd>"
 
+_NOTE_EMPTY = "<dt><b>{}</b></dt><dd />"
+
+# Entities escaped within attribute values (in addition to &, < and >).
+_ATTRIBUTE_ENTITIES = {'"': "&quot;", "\n": "&#10;"}
+
 
 
 class _VocabParserConfiguration(object):
@@ -76,24 +88,116 @@ class _VocabParserConfiguration(object):
         return self._data.get(key, {})
 
 
+class _MindmapWriter(object):
+    """Streams a mindmap to a file, i.e. nodes are written as they are parsed rather
+    than being accumulated within an element tree.
+
+    """
+    def __init__(self, stream):
+        """Instance constructor.
+
+        :param file stream: Stream to which mindmap is written.
+
+        """
+        self.stream = stream
+        self.stack = []
+        self.stream.write("<map>")
+
+
+    def write_node(self, parent, owner, atts):
+        """Writes opening tag of a mindmap node, closing previously written nodes that are not its ancestors.
+
+        :param object parent: Vocab entity associated with parent node (None if root).
+        :param object owner: Vocab entity associated with node.
+        :param dict atts: Node attributes.
+
+        """
+        while self.stack and self.stack[-1] is not parent:
+            self.stack.pop()
+            self.stream.write("</node>")
+        self.stack.append(owner)
+        self.stream.write("<node{}>".format(_get_attributes(atts)))
+
+
+    def write_font(self, atts):
+        """Writes font of current mindmap node.
+
+        :param dict atts: Font attributes.
+
+        """
+        self.stream.write("<font{} />".format(_get_attributes(atts)))
+
+
+    def write_notes(self, notes):
+        """Writes notes of current mindmap node.
+
+        :param list notes: Set of (key, value) note pairs.
+
+        """
+        html = []
+        for k, v in notes:
+            k, v = _encode(k), _encode(v)
+            html.append(_NOTE.format(k, v) if v else _NOTE_EMPTY.format(k))
+
+        self.stream.write('<richcontent TYPE="NOTE">')
+        self.stream.write(_NOTES.format("".join(html)))
+        self.stream.write("</richcontent>")
+
+
+    def close(self):
+        """Closes all open mindmap nodes.
+
+        """
+        while self.stack:
+            self.stack.pop()
+            self.stream.write("</node>")
+        self.stream.write("</map>")
+
+
 class _VocabParser(VocabParser):
-    def __init__(self, realm_filter, stylesheet):
+    def __init__(self, realm_filter, stylesheet, dest):
         """Instance constructor.
 
         """
         super(_VocabParser, self).__init__(realm_filter)
         self.cfg = _VocabParserConfiguration(stylesheet)
-        self.maps = {}
-        self.nodes = {}
-        self.positions = {}
+        self.dest = dest
+        self.process_count = 0
+        self.stream = None
+        self.writer = None
+
+
+    def parse(self):
+        """Parses the CMIP6 vocabulary streaming a mindmap per realm.
+
+        """
+        try:
+            super(_VocabParser, self).parse()
+        finally:
+            self._close_mindmap()
+
+
+    def _open_mindmap(self, realm):
+        """Opens the mindmap file of a realm.
+
+        """
+        self._close_mindmap()
+        self.stream = open(os.path.join(self.dest, "{}.mm".format(realm.id)), 'w')
+        self.writer = _MindmapWriter(self.stream)
+        self.process_count = 0
 
 
-    @property
-    def mindmaps(self):
-        """Returns set of mindmaps.
+    def _close_mindmap(self):
+        """Closes current mindmap file.
 
         """
-        return self.maps.values()
+        if self.stream is None:
+            return
+        try:
+            self.writer.close()
+        finally:
+            self.stream.close()
+            self.stream = self.writer = None
 
 
     def _set_node(self, parent, owner, text=None, style=None, position=None):
@@ -124,12 +228,8 @@ class _VocabParser(VocabParser):
         if position:
             atts['POSITION'] = position
 
-        # Get node parent.
-        if not isinstance(parent, ET.Element):
-            parent = self.nodes[parent]
-
-        # Create new node & cache.
-        self.nodes[owner] = ET.SubElement(parent, 'node', atts)
+        # Write node.
+        self.writer.write_node(parent, owner, atts)
 
         # Set node font / notes.
         self._set_font(owner)
@@ -142,7 +242,7 @@ class _VocabParser(VocabParser):
         """
         cfg = self.cfg.get_section(owner.style_type)
 
-        ET.SubElement(self.nodes[owner], 'font', {
+        self.writer.write_font({
             'BOLD': str(cfg['font-bold']),
             'NAME': cfg['font-name'],
             'SIZE': str(cfg['font-size'])
@@ -159,29 +259,24 @@ class _VocabParser(VocabParser):
         except AttributeError:
             return
 
-        # Convert notes to HTML.
-        notes = [_NOTE.format(k, v) for k, v in owner.notes]
-        notes = _NOTES.format("".join(notes))
-
-        # Inject notes into mindmap.
-        content = ET.SubElement(self.nodes[owner], 'richcontent', {"TYPE": "NOTE"})
-        content.append(ET.fromstring(notes))
+        self.writer.write_notes(notes)
 
 
     def on_realm_parse(self, realm):
         """On realm parse event handler.
 
         """
-        self.maps[realm] = ET.Element('map', {})
-        self._set_node(self.maps[realm], realm, style="fork")
+        self._open_mindmap(realm)
+        self._set_node(None, realm, style="fork")
 
 
     def on_process_parse(self, realm, process):
         """On process parse event handler.
 
         """
-        self.positions[process] = 'left' if len(self.positions) % 2 == 0 else 'right'
-        self._set_node(realm, process, position=self.positions[process])
+        position = 'left' if self.process_count % 2 == 0 else 'right'
+        self.process_count += 1
+        self._set_node(realm, process, position=position)
         self._set_notes(process)
 
 
@@ -209,23 +304,39 @@ class _VocabParser(VocabParser):
             self._set_node(detail_property, choice, text=choice.value)
 
 
+def _encode(value, entities={}):
+    """Returns an xml escaped ascii encoding of a value (non-ascii characters are written as character references)."""
+    if not isinstance(value, basestring):
+        value = str(value)
+    if isinstance(value, str):
+        value = value.decode('utf-8')
+
+    return escape(value, entities).encode('ascii', 'xmlcharrefreplace')
+
+
+def _get_attributes(atts):
+    """Returns xml encoding of a set of attributes ordered by name."""
+    return "".join(' {}="{}"'.format(k, _encode(v, _ATTRIBUTE_ENTITIES))
+                   for k, v in sorted(atts.items()))
+
+
+def _write_realm(args):
+    """Parses a single realm & streams its mindmap to file system.
+
+    """
+    realm, stylesheet, dest = args
+
+    # Perform a vocab parse, each realm's mindmap is written as it is parsed.
+    _VocabParser(realm, stylesheet, dest).parse()
+
+
 def _main(args):
     """Main entry point.
 
     """
-    # Extract input args.
-    realm = args.realm if args.realm not in {"*", "all"} else None
-    stylesheet = args.stylesheet
-
-    # Perform a vocab parse in order to create mindmaps.
-    parser = _VocabParser(realm, stylesheet)
-    parser.parse()
-
-    # Write mindmaps to file system.
-    for realm, mindmap in parser.maps.items():
-        fpath = os.path.join(args.dest, "{}.mm".format(realm.id))
-        with open(fpath, 'w') as f:
-            f.write(ET.tostring(mindmap))
+    map_realms(_write_realm,
+               [(i, args.stylesheet, args.dest) for i in get_realm_names(args.realm)],
+               args.jobs)
 
 
 # Entry point.
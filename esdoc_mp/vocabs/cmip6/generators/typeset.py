@@ -16,6 +16,8 @@ import tornado
 
 from esdoc_mp.ontologies.generators.python import utils
 from esdoc_mp.vocabs.cmip6.core import VocabParser
+from esdoc_mp.vocabs.cmip6.generators.utils import get_realm_names
+from esdoc_mp.vocabs.cmip6.generators.utils import map_realms
 
 
 # Define command line options.
@@ -26,6 +28,20 @@ _ARGS.add_argument(
     dest="dest",
     type=str
     )
+_ARGS.add_argument(
+    "--realm",
+    help="Realm for which typeset will be generated.",
+    dest="realm",
+    type=str,
+    default=None
+    )
+_ARGS.add_argument(
+    "--jobs",
+    help="Number of realms to generate concurrently.",
+    dest="jobs",
+    type=int,
+    default=1
+    )
 
 
 
@@ -41,11 +57,11 @@ def _get_template():
 
 
 class _VocabParser(VocabParser):
-    def __init__(self):
+    def __init__(self, realm_filter=None):
         """Instance constructor.
 
         """
-        super(_VocabParser, self).__init__()
+        super(_VocabParser, self).__init__(realm_filter)
         self.code = {}
         self.vocab = None
         self.template = _get_template()
@@ -65,21 +81,32 @@ class _VocabParser(VocabParser):
         self.code[realm] = self.template.generate(r=realm, u=utils)
 
 
-def _main(args):
-    """Main entry point.
+def _write_realm(args):
+    """Parses a single realm & writes its typeset to file system.
 
     """
+    realm, dest = args
+
     # Simply perform a vocab parse in order to create typeset.
-    parser = _VocabParser()
+    parser = _VocabParser(realm)
     parser.parse()
 
-    # Write typsets to file system.
+    # Write typset to file system.
     for realm, code in parser.code.items():
-        fpath = os.path.join(args.dest, "{}.py".format(realm.id))
+        fpath = os.path.join(dest, "{}.py".format(realm.id))
         with open(fpath, 'w') as f:
             f.write(code)
 
 
+def _main(args):
+    """Main entry point.
+
+    """
+    map_realms(_write_realm,
+               [(i, args.dest) for i in get_realm_names(args.realm)],
+               args.jobs)
+
+
 # Entry point.
 if __name__ == '__main__':
     _main(_ARGS.parse_args())
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: utils.py
+   :platform: Unix, Windows
+   :synopsis: Utility functions shared by CMIP6 vocab generators.
+
+.. moduleauthor:: Mark Conway-Greenslade <momipsl@ipsl.jussieu.fr>
+
+
+"""
+import multiprocessing
+
+from esdoc_mp.vocabs.cmip6 import schema
+
+
+
+def get_realm_names(realm_filter=None):
+    """Returns names of realms to be generated.
+
+    :param str realm_filter: Name of a realm (if None or * or all then all realms are returned).
+
+    """
+    names = sorted(i.__name__.split(".")[-1] for i in schema.realms)
+    if realm_filter in {None, "*", "all"}:
+        return names
+
+    return [i for i in names if i == realm_filter]
+
+
+def map_realms(func, items, jobs=1):
+    """Applies a realm generation function to a set of per realm work items.
+
+    Each realm is parsed, rendered & written independently so that at most one
+    realm per process is held in memory.
+
+    :param function func: Module level function generating a single realm.
+    :param list items: Set of per realm work items.
+    :param int jobs: Number of realms to generate concurrently.
+
+    :returns: Function results in item order.
+    :rtype: list
+
+    """
+    if jobs <= 1 or len(items) <= 1:
+        return [func(i) for i in items]
+
+    pool = multiprocessing.Pool(min(jobs, len(items)))
+    try:
+        return pool.map(func, items, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: tests.test_schema_validation.py
+   :platform: Unix, Windows
+   :synopsis: Unit tests of ontology schema validation.
+
+.. moduleauthor:: Mark Conway-Greenslade <momipsl@ipsl.jussieu.fr>
+
+
+"""
+import collections
+import sys
+import traceback
+import types
+import unittest
+
+from esdoc_mp.ontologies.core.schema_validation import validate
+from esdoc_mp.ontologies.core.schema_validation import ValidationContext
+from esdoc_mp.ontologies.schemas import get_schema
+
+
+
+def _get_factory(name, result, calls):
+    """Returns a documented no-arg factory function that counts its invocations."""
+    def factory():
+        calls[name] += 1
+        return result
+
+    factory.__name__ = name
+    factory.__doc__ = "Test {0}.".format(name)
+
+    return factory
+
+
+def _get_schema(calls):
+    """Returns a valid test schema whose factories record their invocations."""
+    module = types.ModuleType("test.pkg_classes")
+    module.cls_a = _get_factory('cls_a', {
+        'type': 'class',
+        'base': None,
+        'is_abstract': False,
+        'properties': [
+            ('name', 'str', '1.1'),
+            ('related', 'pkg.cls_b', '0.N')
+            ]
+        }, calls)
+    module.cls_b = _get_factory('cls_b', {
+        'type': 'class',
+        'base': 'pkg.cls_a',
+        'is_abstract': False,
+        'properties': [
+            ('kind', 'pkg.kinds', '0.1')
+            ]
+        }, calls)
+    module.kinds = _get_factory('kinds', {
+        'type': 'enum',
+        'is_open': False,
+        'members': [
+            ('alpha', 'Alpha kind.'),
+            ('beta', 'Beta kind.')
+            ]
+        }, calls)
+
+    schema = types.ModuleType('test')
+    schema.NAME = 'test'
+    schema.VERSION = '1'
+    schema.DOC = 'Test schema.'
+    schema.pkg = _get_factory('pkg', {module}, calls)
+
+    return schema
+
+
+def _raise_error():
+    """Test factory that raises an error."""
+    raise ValueError("factory error")
+
+
+class ValidationTestCase(unittest.TestCase):
+    """Schema validation unit tests.
+
+    """
+    def test_validate_cim(self):
+        """Test that the cim schemas are valid."""
+        for version in ('1', '2'):
+            self.assertEqual(validate(get_schema('cim', version)), [])
+
+
+    def test_validate_invokes_factories_once(self):
+        """Test that validation invokes each schema factory a single time."""
+        calls = collections.Counter()
+        report = validate(_get_schema(calls))
+
+        self.assertEqual(report, [])
+        self.assertEqual(calls, {'pkg': 1, 'cls_a': 1, 'cls_b': 1, 'kinds': 1})
+
+
+    def test_invoke_caches_result(self):
+        """Test that the context returns the cached result of a factory."""
+        calls = collections.Counter()
+        schema = _get_schema(calls)
+        ctx = ValidationContext(schema)
+
+        self.assertIs(ctx.invoke(schema.pkg), ctx.invoke(schema.pkg))
+        self.assertEqual(calls['pkg'], 1)
+
+
+    def test_invoke_reraises_original_traceback(self):
+        """Test that a factory error is re-raised with the factory's traceback."""
+        ctx = ValidationContext(_get_schema(collections.Counter()))
+        for _ in range(2):
+            try:
+                ctx.invoke(_raise_error)
+            except ValueError as err:
+                frames = traceback.extract_tb(sys.exc_info()[2])
+            else:
+                self.fail("factory error not raised")
+            self.assertEqual(str(err), "factory error")
+            self.assertEqual(frames[-1][2], '_raise_error')
+
+
+# Entry point.
+if __name__ == '__main__':
+    unittest.main()